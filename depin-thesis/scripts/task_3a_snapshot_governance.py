@@ -8,9 +8,23 @@ Uses the Snapshot GraphQL API to get:
 3. Voting power concentration (if available via strategies)
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "meshnet-simulation", "src"))
+from inequality import hhi_gini
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; falls back to the stdlib encoder
+    orjson = None
+    _json_dumps = json.dumps
 
 OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
 SNAPSHOT_API = "https://hub.snapshot.org/graphql"
@@ -33,14 +47,85 @@ SPACE_ALTERNATES = {
     "graphprotocol.eth": ["thegraphcouncil.eth", "graph-protocol.eth"],
 }
 
+# Proposals with fewer votes than this are too thin for a concentration measure
+MIN_PROPOSAL_VOTES = 10
+# Upper bound on voters fetched per proposal (ordered by voting power)
+MAX_VOTERS = 200
+
+# GraphQL documents, built once at import
+_SPACE_Q = """
+query Space($id: String!) {
+    space(id: $id) {
+        id
+        name
+        about
+        members
+        proposalsCount
+        followersCount
+        voting {
+            delay
+            period
+            quorum
+        }
+    }
+}
+"""
+
+_PROPS_Q = """
+query Proposals($space: String!, $limit: Int!) {
+    proposals(
+        where: { space: $space, state: "closed" },
+        orderBy: "created",
+        orderDirection: desc,
+        first: $limit
+    ) {
+        id
+        title
+        state
+        votes
+        scores_total
+        quorum
+        created
+        end
+    }
+}
+"""
+
+_VOTES_Q = """
+query Votes($proposal: String!, $limit: Int!) {
+    votes(
+        where: { proposal: $proposal },
+        orderBy: "vp",
+        orderDirection: desc,
+        first: $limit
+    ) {
+        voter
+        vp
+        choice
+    }
+}
+"""
+
+# One keep-alive session for every query: a single TLS handshake to the hub.
+# GraphQL reads are idempotent, so POST is safe to retry on throttling/5xx.
+_SESSION = requests.Session()
+_SESSION.headers["Content-Type"] = "application/json"
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=1,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset({"POST"}),
+                      raise_on_status=False),
+))
+
 
 def query_snapshot(query, variables=None):
     """Execute Snapshot GraphQL query."""
     try:
-        resp = requests.post(
+        resp = _SESSION.post(
             SNAPSHOT_API,
-            json={"query": query, "variables": variables or {}},
-            headers={"Content-Type": "application/json"},
+            data=_json_dumps({"query": query, "variables": variables or {}}),
             timeout=30,
         )
         if resp.status_code == 200:
@@ -53,67 +138,17 @@ def query_snapshot(query, variables=None):
 
 def get_space_info(space_id):
     """Get basic space information."""
-    query = """
-    query Space($id: String!) {
-        space(id: $id) {
-            id
-            name
-            about
-            members
-            proposalsCount
-            followersCount
-            voting {
-                delay
-                period
-                quorum
-            }
-        }
-    }
-    """
-    return query_snapshot(query, {"id": space_id})
+    return query_snapshot(_SPACE_Q, {"id": space_id})
 
 
 def get_recent_proposals(space_id, limit=20):
     """Get recent proposals with vote counts."""
-    query = """
-    query Proposals($space: String!, $limit: Int!) {
-        proposals(
-            where: { space: $space, state: "closed" },
-            orderBy: "created",
-            orderDirection: desc,
-            first: $limit
-        ) {
-            id
-            title
-            state
-            votes
-            scores_total
-            quorum
-            created
-            end
-        }
-    }
-    """
-    return query_snapshot(query, {"space": space_id, "limit": limit})
+    return query_snapshot(_PROPS_Q, {"space": space_id, "limit": limit})
 
 
 def get_top_voters(proposal_id, limit=50):
     """Get top voters for a specific proposal."""
-    query = """
-    query Votes($proposal: String!, $limit: Int!) {
-        votes(
-            where: { proposal: $proposal },
-            orderBy: "vp",
-            orderDirection: desc,
-            first: $limit
-        ) {
-            voter
-            vp
-            choice
-        }
-    }
-    """
-    return query_snapshot(query, {"proposal": proposal_id, "limit": limit})
+    return query_snapshot(_VOTES_Q, {"proposal": proposal_id, "limit": limit})
 
 
 def compute_voting_concentration(votes):
@@ -121,24 +156,19 @@ def compute_voting_concentration(votes):
     if not votes or len(votes) < 2:
         return None, None, None, None
 
-    vps = sorted([v.get("vp", 0) for v in votes if v.get("vp", 0) > 0], reverse=True)
-    if not vps:
+    vps_asc = np.sort(np.array([v.get("vp", 0) for v in votes if v.get("vp", 0) > 0],
+                               dtype=float))
+    if not vps_asc.size:
         return None, None, None, None
 
-    total = sum(vps)
-    shares = [v / total for v in vps]
-
-    hhi = sum(s**2 for s in shares)
+    total = vps_asc.sum()
+    n = vps_asc.size
 
-    n = len(vps)
-    sorted_vps = sorted(vps)
-    cum = 0
-    for i, v in enumerate(sorted_vps):
-        cum += (2 * (i + 1) - n - 1) * v
-    gini = abs(cum / (n * total)) if total > 0 and n > 1 else 0
+    hhi, gini = hhi_gini(vps_asc, presorted=True)
+    gini = abs(gini) if n > 1 else 0
 
-    top1 = vps[0] / total if vps else 0
-    top10 = sum(vps[:10]) / total if len(vps) >= 10 else None
+    top1 = float(vps_asc[-1] / total)
+    top10 = float(vps_asc[-10:].sum() / total) if n >= 10 else None
 
     return round(hhi, 6), round(gini, 4), round(top1, 4), round(top10, 4) if top10 else None
 
@@ -195,8 +225,13 @@ def main():
             best = max(proposals, key=lambda p: p.get("votes", 0))
             print(f"    Best proposal: '{best.get('title', '?')[:50]}...' ({best.get('votes', 0)} votes)")
 
-            votes_data = get_top_voters(best["id"])
-            votes = votes_data.get("votes", []) if votes_data else []
+            n_votes = best.get("votes", 0)
+            if n_votes < MIN_PROPOSAL_VOTES:
+                print(f"    Skipping voter fetch (< {MIN_PROPOSAL_VOTES} votes)")
+                votes = []
+            else:
+                votes_data = get_top_voters(best["id"], limit=min(n_votes, MAX_VOTERS))
+                votes = votes_data.get("votes", []) if votes_data else []
 
             if votes:
                 hhi, gini, top1, top10 = compute_voting_concentration(votes)
@@ -233,8 +268,13 @@ def main():
 
     # Save results
     json_path = os.path.join(OUTPUT_DIR, "snapshot_governance_data.json")
-    with open(json_path, "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    if orjson is not None:
+        with open(json_path, "wb") as f:
+            f.write(orjson.dumps(
+                results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(json_path, "w") as f:
+            json.dump(results, f, indent=2, default=str)
 
     print("\n" + "=" * 60)
     print("SNAPSHOT GOVERNANCE SUMMARY")
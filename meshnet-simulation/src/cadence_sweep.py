@@ -8,10 +8,12 @@ Key question: Does 14-day cadence outperform 7-day on noise filtering
 while outperforming 30-day on shock responsiveness?
 Output: results/cadence_sensitivity_results.csv
 """
+import os
 import sys
 import numpy as np
 import pandas as pd
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from meshnet_model import (run_simulation, SCENARIOS, SEED, N_TARGET,
@@ -22,75 +24,66 @@ import meshnet_model as mm
 CADENCES = [7, 14, 21, 30]
 
 
+def _response_time(e_series, scenario):
+    """Days after the shock until emission moves >5% off its pre-shock mean."""
+    shock_month = scenario.get("shock_month")
+    if not shock_month:
+        return None
+    shock_day = shock_month * 30
+    pre_shock_e = e_series[max(0, shock_day - 10):shock_day]
+    if not pre_shock_e.size:
+        return None
+    pre_mean = pre_shock_e.mean()
+    window = e_series[shock_day:shock_day + 180]
+    moved = np.flatnonzero(np.abs(window - pre_mean) / max(pre_mean, 1) > 0.05)
+    return int(moved[0]) if moved.size else None
+
+
+def _run(job):
+    """Worker: one (cadence, scenario) run. PID_CADENCE is a module global,
+    so it is set inside the worker process before simulating.
+    Returns the emission series plus the final N and P."""
+    count, total, cadence, sname, scenario, seed = job
+    mm.PID_CADENCE = cadence
+    print(f"  [{count}/{total}] cadence={cadence}d, {sname}", file=sys.stderr)
+    run = run_simulation(sname, scenario, True, seed, return_arrays=True)
+    return run["E"], int(run["N"][-1]), float(run["P"][-1])
+
+
 def main():
     print("=" * 60)
     print("CADENCE SENSITIVITY SWEEP")
     print(f"Cadences: {CADENCES} × {len(SCENARIOS)} scenarios = {len(CADENCES)*len(SCENARIOS)} runs")
     print("=" * 60)
 
-    results = []
     total = len(CADENCES) * len(SCENARIOS)
-    count = 0
-
-    original_cadence = mm.PID_CADENCE
-
+    jobs = []
     for cadence in CADENCES:
-        # Temporarily set PID cadence
-        mm.PID_CADENCE = cadence
-
         for scenario_idx, (sname, scenario) in enumerate(SCENARIOS.items()):
-            count += 1
-            seed = SEED + scenario_idx
-            print(f"  [{count}/{total}] cadence={cadence}d, {sname}", file=sys.stderr)
-
-            records = run_simulation(sname, scenario, True, seed)
-            final = records[-1]
-
-            n_series = [r["N"] for r in records]
-            e_series = [r["E"] for r in records]
-
-            # Count emission adjustments (times E changed)
-            adjustments = sum(1 for i in range(1, len(e_series))
-                              if e_series[i] != e_series[i-1])
-
-            # Time at floor/ceiling
-            at_floor = sum(1 for e in e_series if e <= PID_MIN + 1)
-            at_ceiling = sum(1 for e in e_series if e >= PID_MAX - 1)
-
-            # Emission volatility
-            e_std = float(np.std(e_series))
-
-            # Response time to shock (if shock exists)
-            shock_month = scenario.get("shock_month")
-            response_time = None
-            if shock_month:
-                shock_day = shock_month * 30
-                pre_shock_e = e_series[max(0, shock_day - 10):shock_day]
-                if pre_shock_e:
-                    pre_mean = np.mean(pre_shock_e)
-                    for t in range(shock_day, min(shock_day + 180, len(e_series))):
-                        if abs(e_series[t] - pre_mean) / max(pre_mean, 1) > 0.05:
-                            response_time = t - shock_day
-                            break
-
-            results.append({
-                "cadence_days": cadence,
-                "scenario": sname,
-                "final_N": final["N"],
-                "dev_from_target": round(abs(final["N"] - N_TARGET) / N_TARGET, 4),
-                "n_adjustments": adjustments,
-                "at_floor_steps": at_floor,
-                "at_ceiling_steps": at_ceiling,
-                "total_emission": sum(e_series),
-                "emission_volatility": round(e_std, 1),
-                "response_time_days": response_time,
-                "final_P": final["P"],
-            })
-
-    # Restore original cadence
-    mm.PID_CADENCE = original_cadence
-
-    df = pd.DataFrame(results)
+            jobs.append((len(jobs) + 1, total, cadence, sname, scenario, SEED + scenario_idx))
+
+    # Runs are independent and CPU-bound: one process per (cadence, scenario)
+    with ProcessPoolExecutor(max_workers=min(total, os.cpu_count() or 1)) as ex:
+        results = list(ex.map(_run, jobs))
+
+    # One (runs × T) emission matrix; every metric is a row-wise reduction
+    E = np.stack([e for e, _, _ in results])
+    final_N = np.array([n for _, n, _ in results])
+    final_P = np.array([p for _, _, p in results])
+
+    df = pd.DataFrame({
+        "cadence_days": [job[2] for job in jobs],
+        "scenario": [job[3] for job in jobs],
+        "final_N": final_N,
+        "dev_from_target": np.round(np.abs(final_N - N_TARGET) / N_TARGET, 4),
+        "n_adjustments": np.count_nonzero(np.diff(E, axis=1), axis=1),
+        "at_floor_steps": np.count_nonzero(E <= PID_MIN + 1, axis=1),
+        "at_ceiling_steps": np.count_nonzero(E >= PID_MAX - 1, axis=1),
+        "total_emission": E.sum(axis=1),
+        "emission_volatility": np.round(E.std(axis=1), 1),
+        "response_time_days": [_response_time(e, job[4]) for e, job in zip(E, jobs)],
+        "final_P": final_P,
+    })
     out = RESULTS_DIR / "cadence_sensitivity_results.csv"
     df.to_csv(out, index=False)
     print(f"\nSaved: {out} ({len(df)} rows)")
@@ -9,10 +9,43 @@ import pandas as pd
 from pathlib import Path
 
 import data_loader
+from numba_compat import njit
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; falls back to the stdlib encoder
+    orjson = None
 
 OUT = Path(__file__).resolve().parent.parent / "calibration_params.json"
 
 
+def fit_logistic(t, y, bounds=((0.5, 5.0), (0.01, 1.0), (10.0, 50.0)),
+                 n_grid=201, rounds=5):
+    """Least-squares fit of y = L / (1 + exp(-k*(t - t0))) without an iterative solver.
+
+    For fixed (k, t0) the model is linear in L, so L has a closed form
+    Σ(y·f)/Σ(f²). The (k, t0) plane is searched with a vectorized grid that
+    is zoomed around the best cell each round. Deterministic; no scipy.
+    """
+    t = np.asarray(t, dtype=float)
+    y = np.asarray(y, dtype=float)
+    (L_lo, L_hi), (k_lo, k_hi), (t0_lo, t0_hi) = bounds
+    k_min, k_max, t0_min, t0_max = k_lo, k_hi, t0_lo, t0_hi
+    for _ in range(rounds):
+        ks = np.linspace(k_lo, k_hi, n_grid)
+        t0s = np.linspace(t0_lo, t0_hi, n_grid)
+        f = 1.0 / (1.0 + np.exp(-ks[:, None, None] * (t - t0s[None, :, None])))
+        L = np.clip((f * y).sum(-1) / (f * f).sum(-1), L_lo, L_hi)
+        sse = ((L[..., None] * f - y) ** 2).sum(-1)
+        i, j = np.unravel_index(sse.argmin(), sse.shape)
+        best = (float(L[i, j]), float(ks[i]), float(t0s[j]))
+        dk = 4 * (k_hi - k_lo) / (n_grid - 1)
+        dt = 4 * (t0_hi - t0_lo) / (n_grid - 1)
+        k_lo, k_hi = max(k_min, ks[i] - dk), min(k_max, ks[i] + dk)
+        t0_lo, t0_hi = max(t0_min, t0s[j] - dt), min(t0_max, t0s[j] + dt)
+    return best
+
+
 def calibrate_s2r(s2r_df: pd.DataFrame) -> dict:
     """Derive burn-mint trajectory parameters from Helium S2R."""
     s2r = s2r_df["s2r_clean"].values
@@ -36,38 +69,34 @@ def calibrate_s2r(s2r_df: pd.DataFrame) -> dict:
     s2r_smooth = s2r_df["s2r_3m_rolling"].dropna().values
     months_smooth = months[:len(s2r_smooth)]
     if len(s2r_smooth) > 5:
-        from scipy.optimize import curve_fit
-        def logistic(t, L, k, t0):
-            return L / (1 + np.exp(-k * (t - t0)))
-        try:
-            popt, _ = curve_fit(logistic, months_smooth, s2r_smooth,
-                                p0=[2.0, 0.15, 25], maxfev=5000,
-                                bounds=([0.5, 0.01, 10], [5.0, 1.0, 50]))
-            milestones["logistic_L"] = round(float(popt[0]), 4)
-            milestones["logistic_k"] = round(float(popt[1]), 4)
-            milestones["logistic_t0"] = round(float(popt[2]), 2)
-        except Exception:
-            milestones["logistic_L"] = 2.0
-            milestones["logistic_k"] = 0.15
-            milestones["logistic_t0"] = 28.0
+        L, k, t0 = fit_logistic(months_smooth, s2r_smooth)
+        milestones["logistic_L"] = round(L, 4)
+        milestones["logistic_k"] = round(k, 4)
+        milestones["logistic_t0"] = round(t0, 2)
 
     return milestones
 
 
 def calibrate_emission(issuance_df: pd.DataFrame, current: dict) -> dict:
     """Derive emission schedule parameters from Helium issuance."""
-    weekly_issued = issuance_df["hnt_issued"].values
+    weekly_issued = issuance_df["hnt_issued"].to_numpy(dtype=np.float64)
     total_supply = current.get("total_supply", 223_000_000)
     circulating = current.get("circulating_supply", 186_000_000)
 
+    # One cumulative sum serves the overall and per-half means
+    n = len(weekly_issued)
+    mid = n // 2
+    csum = np.cumsum(weekly_issued)
+
     # Weekly stats
-    mean_weekly = float(np.mean(weekly_issued))
-    std_weekly = float(np.std(weekly_issued))
+    mean_weekly = float(csum[-1] / n)
+    std_weekly = float(np.sqrt(np.mean((weekly_issued - mean_weekly) ** 2)))
     mean_daily = mean_weekly / 7
 
     # Detect halving: compare first half vs second half
-    mid = len(weekly_issued) // 2
-    ratio = float(np.mean(weekly_issued[mid:]) / max(np.mean(weekly_issued[:mid]), 1))
+    half1_mean = csum[mid - 1] / mid
+    half2_mean = (csum[-1] - csum[mid - 1]) / (n - mid)
+    ratio = float(half2_mean / max(half1_mean, 1))
 
     return {
         "helium_total_supply": total_supply,
@@ -85,19 +114,64 @@ def calibrate_emission(issuance_df: pd.DataFrame, current: dict) -> dict:
     }
 
 
+@njit(cache=True)
+def ou_stats(prices):
+    """Daily log-return std and lag-1 autocorrelation in one pass over prices.
+
+    Non-positive and NaN prices are skipped. Welford update for the return variance,
+    co-moment update for the (r[i-1], r[i]) Pearson correlation.
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    k = 0
+    mx = 0.0
+    my = 0.0
+    sxx = 0.0
+    syy = 0.0
+    sxy = 0.0
+    prev_log = 0.0
+    prev_r = 0.0
+    started = False
+    for p in prices:
+        if not p > 0:  # also skips NaN gaps
+            continue
+        lp = np.log(p)
+        if not started:
+            prev_log = lp
+            started = True
+            continue
+        r = lp - prev_log
+        prev_log = lp
+        n += 1
+        d = r - mean
+        mean += d / n
+        m2 += d * (r - mean)
+        if n > 1:
+            k += 1
+            dx = prev_r - mx
+            mx += dx / k
+            dy = r - my
+            my += dy / k
+            sxx += dx * (prev_r - mx)
+            syy += dy * (r - my)
+            sxy += dx * (r - my)
+        prev_r = r
+    daily_vol = np.sqrt(m2 / n) if n else np.nan
+    autocorr = sxy / np.sqrt(sxx * syy) if sxx * syy else np.nan
+    return daily_vol, autocorr
+
+
 def calibrate_price(price_df: pd.DataFrame) -> dict:
     """Derive Ornstein-Uhlenbeck parameters from HNT price data."""
-    prices = price_df["hnt_price_usd"].values
-    log_prices = np.log(prices[prices > 0])
-    log_returns = np.diff(log_prices)
+    prices = price_df["hnt_price_usd"].to_numpy(dtype=np.float64)
 
-    # Annualized volatility
-    daily_vol = float(np.std(log_returns))
+    # Log-return volatility and lag-1 autocorrelation (negative = mean-reverting)
+    daily_vol, autocorr = ou_stats(prices)
+    daily_vol = float(daily_vol)
+    autocorr = float(autocorr)
     annual_vol = daily_vol * np.sqrt(365)
 
-    # Autocorrelation (lag-1) — negative = mean-reverting
-    autocorr = float(np.corrcoef(log_returns[:-1], log_returns[1:])[0, 1])
-
     # OU mean-reversion speed: κ ≈ -ln(autocorr) per day
     kappa = -np.log(max(abs(autocorr), 0.01))
 
@@ -129,37 +203,52 @@ def calibrate_governance(gov_df: pd.DataFrame) -> dict:
         "real_gini_mean": round(float(np.mean(gini_vals)), 4),
         "protocols": [],
     }
-    for _, row in gov_df.iterrows():
+    names = gov_df["protocol"].to_numpy()
+    hhi_col = gov_df["hhi"].to_numpy(dtype=float).round(4)
+    gini_col = gov_df["gini"].to_numpy(dtype=float).round(4)
+    if "top1_share" in gov_df.columns:
+        top1_col = gov_df["top1_share"].to_numpy(dtype=float).round(4)
+    else:
+        top1_col = np.full(len(gov_df), np.nan)
+    has_cat = "category" in gov_df.columns
+    cats = gov_df["category"].to_numpy() if has_cat else [None] * len(gov_df)
+    cat_ok = gov_df["category"].notna().to_numpy() if has_cat else [False] * len(gov_df)
+    for name, hhi, gini, top1, cat, ok in zip(names, hhi_col, gini_col, top1_col, cats, cat_ok):
         entry = {
-            "name": row["protocol"],
-            "hhi": round(float(row["hhi"]), 4),
-            "gini": round(float(row["gini"]), 4),
-            "top1": round(float(row["top1_share"]), 4) if pd.notna(row.get("top1_share")) else None,
+            "name": name,
+            "hhi": float(hhi),
+            "gini": float(gini),
+            "top1": None if np.isnan(top1) else float(top1),
         }
-        if "category" in row and pd.notna(row.get("category")):
-            entry["category"] = row["category"]
+        if ok:
+            entry["category"] = cat
         benchmarks["protocols"].append(entry)
 
-    # Category-level summaries
-    if "category" in gov_df.columns:
+    # Category-level summaries (one group-by scan)
+    if has_cat:
+        stats = gov_df.groupby("category")[["hhi", "gini"]].agg(["count", "min", "max", "mean"])
         for cat in ["defi", "depin"]:
-            sub = gov_df[gov_df["category"] == cat]
-            if len(sub) > 0:
-                sub_hhi = sub["hhi"].dropna()
-                sub_gini = sub["gini"].dropna()
-                benchmarks[f"{cat}_n"] = len(sub_hhi)
-                benchmarks[f"{cat}_hhi_min"] = round(float(sub_hhi.min()), 4)
-                benchmarks[f"{cat}_hhi_max"] = round(float(sub_hhi.max()), 4)
-                benchmarks[f"{cat}_hhi_mean"] = round(float(sub_hhi.mean()), 4)
-                benchmarks[f"{cat}_gini_mean"] = round(float(sub_gini.mean()), 4)
+            if cat in stats.index:
+                row = stats.loc[cat]
+                benchmarks[f"{cat}_n"] = int(row[("hhi", "count")])
+                benchmarks[f"{cat}_hhi_min"] = round(float(row[("hhi", "min")]), 4)
+                benchmarks[f"{cat}_hhi_max"] = round(float(row[("hhi", "max")]), 4)
+                benchmarks[f"{cat}_hhi_mean"] = round(float(row[("hhi", "mean")]), 4)
+                benchmarks[f"{cat}_gini_mean"] = round(float(row[("gini", "mean")]), 4)
 
     # MeshNet target: reputation-weighted governance should compress
     # Use DeFi min as baseline (DeFi represents mature governance)
-    defi_hhi = gov_df[gov_df.get("category", "defi") == "defi"]["hhi"].dropna() if "category" in gov_df.columns else gov_df["hhi"].dropna()
-    defi_gini = gov_df[gov_df.get("category", "defi") == "defi"]["gini"].dropna() if "category" in gov_df.columns else gov_df["gini"].dropna()
-    if len(defi_hhi) > 0:
-        benchmarks["mesh_target_gini"] = round(float(defi_gini.min()) * 0.85, 4)
-        benchmarks["mesh_target_hhi"] = round(float(defi_hhi.min()) * 0.6, 4)
+    if has_cat:
+        defi_n = int(stats.loc["defi", ("hhi", "count")]) if "defi" in stats.index else 0
+        defi_hhi_min = stats.loc["defi", ("hhi", "min")] if defi_n else np.nan
+        defi_gini_min = stats.loc["defi", ("gini", "min")] if defi_n else np.nan
+    else:
+        defi_n = len(hhi_vals)
+        defi_hhi_min = np.min(hhi_vals) if defi_n else np.nan
+        defi_gini_min = np.min(gini_vals) if len(gini_vals) else np.nan
+    if defi_n > 0:
+        benchmarks["mesh_target_gini"] = round(float(defi_gini_min) * 0.85, 4)
+        benchmarks["mesh_target_hhi"] = round(float(defi_hhi_min) * 0.6, 4)
     else:
         benchmarks["mesh_target_gini"] = round(float(np.min(gini_vals)) * 0.85, 4)
         benchmarks["mesh_target_hhi"] = round(float(np.min(hhi_vals)) * 0.6, 4)
@@ -214,8 +303,12 @@ def main():
         print(f"   MeshNet target Gini: {g['mesh_target_gini']:.4f}")
 
     # Save
-    with open(OUT, "w") as f:
-        json.dump(params, f, indent=2, default=str)
+    if orjson is not None:
+        OUT.write_bytes(orjson.dumps(
+            params, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(OUT, "w") as f:
+            json.dump(params, f, indent=2, default=str)
     print(f"\nSaved: {OUT}")
 
 
@@ -5,10 +5,17 @@ Parses Helium on-chain data, governance metrics, and price data
 from the DePIN dataset.
 """
 import json
+import functools
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json accepts bytes too
+    _json_loads = json.loads
+
 # ── Data paths ────────────────────────────────────────────────
 BASE = Path(__file__).resolve().parent.parent
 DEPIN_THESIS = BASE.parent / "depin-thesis"
@@ -25,34 +32,80 @@ PATHS = {
     "protocol_profiles": DEPIN_DATA / "expansion" / "consolidated_expansion_results.json",
 }
 
-
-def _parse_dune_json(path: Path) -> pd.DataFrame:
-    """Parse Dune Analytics JSON response format."""
-    with open(path) as f:
-        data = json.load(f)
+# Parquet cache for parsed sources (needs pyarrow; disabled without it)
+CACHE_DIR = BASE / ".cache"
+try:
+    import pyarrow  # noqa: F401
+    _PARQUET = True
+except ImportError:
+    _PARQUET = False
+
+
+def _cached(name: str):
+    """Cache a DataFrame loader as .cache/{name}.parquet.
+
+    The cache is reused while it is newer than both the source file and this
+    module (so edits to the loaders invalidate it). Typed columns, including
+    datetimes, round-trip natively, so re-reads skip CSV/JSON parsing.
+    """
+    source = PATHS[name]
+
+    def decorator(loader):
+        @functools.wraps(loader)
+        def wrapper():
+            if not _PARQUET:
+                return loader()
+            cache_path = CACHE_DIR / f"{name}.parquet"
+            stamp = max(source.stat().st_mtime, Path(__file__).stat().st_mtime)
+            if cache_path.exists() and cache_path.stat().st_mtime >= stamp:
+                return pd.read_parquet(cache_path)
+            df = loader()
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                df.to_parquet(cache_path, compression="zstd", index=False)
+            except OSError:
+                pass  # read-only checkout: serve uncached
+            return df
+        return wrapper
+    return decorator
+
+
+def _parse_dune_json(path: Path, columns=None) -> pd.DataFrame:
+    """Parse Dune Analytics JSON response format.
+
+    If `columns` is given, only those fields are extracted (missing ones are
+    skipped) and the DataFrame is built column-wise from the row dicts.
+    """
+    data = _json_loads(path.read_bytes())
     rows = data.get("result", {}).get("rows", [])
     if not rows:
         raise ValueError(f"No rows found in {path}")
-    df = pd.DataFrame(rows)
+    if columns is None:
+        df = pd.DataFrame(rows)
+    else:
+        present = [c for c in columns if c in rows[0]]
+        df = pd.DataFrame({c: [r.get(c) for r in rows] for c in present})
     if "week" in df.columns:
         df["week"] = pd.to_datetime(df["week"])
         df = df.sort_values("week").reset_index(drop=True)
     return df
 
 
+@_cached("weekly_burns")
 def load_weekly_burns() -> pd.DataFrame:
     """Load weekly HNT burn data (149 weeks)."""
-    df = _parse_dune_json(PATHS["weekly_burns"])
-    return df[["week", "hnt_burned", "usd_burned", "burn_txns"]]
+    return _parse_dune_json(PATHS["weekly_burns"],
+                            ["week", "hnt_burned", "usd_burned", "burn_txns"])
 
 
+@_cached("weekly_issuance")
 def load_weekly_issuance() -> pd.DataFrame:
     """Load weekly HNT issuance data (149 weeks)."""
-    df = _parse_dune_json(PATHS["weekly_issuance"])
-    cols = [c for c in ["week", "hnt_issued", "usd_issued"] if c in df.columns]
-    return df[cols]
+    return _parse_dune_json(PATHS["weekly_issuance"],
+                            ["week", "hnt_issued", "usd_issued"])
 
 
+@_cached("s2r_cleaned")
 def load_s2r_cleaned() -> pd.DataFrame:
     """Load cleaned monthly S2R data (35 months)."""
     df = pd.read_csv(PATHS["s2r_cleaned"])
@@ -62,6 +115,7 @@ def load_s2r_cleaned() -> pd.DataFrame:
     return df
 
 
+@_cached("hnt_price")
 def load_hnt_price() -> pd.DataFrame:
     """Load daily HNT price data."""
     df = pd.read_csv(PATHS["hnt_price"])
@@ -76,6 +130,7 @@ def load_hnt_current() -> dict:
         return json.load(f)
 
 
+@_cached("governance")
 def load_governance() -> pd.DataFrame:
     """Load corrected governance concentration metrics (DeFi + DePIN protocols)."""
     df = pd.read_csv(PATHS["governance"])
@@ -33,30 +33,41 @@ SCENARIO_COLORS = {
     'regulatory': '#533483',
 }
 
+_RC = {
+    'figure.facecolor': COLORS['bg'],
+    'axes.facecolor': COLORS['bg'],
+    'axes.edgecolor': COLORS['grid'],
+    'axes.grid': True,
+    'grid.alpha': 0.3,
+    'grid.color': COLORS['grid'],
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['Arial', 'Helvetica', 'DejaVu Sans'],
+    'font.size': 11,
+    'axes.titlesize': 16,
+    'axes.titleweight': 'bold',
+    'axes.labelsize': 12,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10,
+    'legend.fontsize': 10,
+    'figure.titlesize': 16,
+    'figure.titleweight': 'bold',
+    'figure.dpi': 150,
+    'savefig.dpi': 300,
+    'legend.framealpha': 0.9,
+    'legend.edgecolor': COLORS['grid'],
+    # Let Agg render very long paths in chunks instead of one huge path
+    'agg.path.chunksize': 10000,
+}
+
+_style_applied = False
+
 def setup_style():
-    plt.rcParams.update({
-        'figure.facecolor': COLORS['bg'],
-        'axes.facecolor': COLORS['bg'],
-        'axes.edgecolor': COLORS['grid'],
-        'axes.grid': True,
-        'grid.alpha': 0.3,
-        'grid.color': COLORS['grid'],
-        'font.family': 'sans-serif',
-        'font.sans-serif': ['Arial', 'Helvetica', 'DejaVu Sans'],
-        'font.size': 11,
-        'axes.titlesize': 16,
-        'axes.titleweight': 'bold',
-        'axes.labelsize': 12,
-        'xtick.labelsize': 10,
-        'ytick.labelsize': 10,
-        'legend.fontsize': 10,
-        'figure.titlesize': 16,
-        'figure.titleweight': 'bold',
-        'figure.dpi': 150,
-        'savefig.dpi': 300,
-        'legend.framealpha': 0.9,
-        'legend.edgecolor': COLORS['grid'],
-    })
+    """Apply house rcParams once per process; later calls are no-ops."""
+    global _style_applied
+    if _style_applied:
+        return
+    plt.rcParams.update(_RC)
+    _style_applied = True
 
 def hide_spines(ax, keep_left=True, keep_bottom=True):
     ax.spines['top'].set_visible(False)
@@ -10,141 +10,167 @@ Also: V(i) = τ(i) × (1 + log(1 + R(i))) (logarithmic)
 
 Key question: Is quadratic (p=2) optimal for capture resistance?
 Output: results/exponent_sensitivity_results.csv
+Caches the final bull/PID population in results/bull_pid_final_agents.npz (--no-cache to rebuild).
 """
 import sys
+import argparse
 import numpy as np
 import pandas as pd
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from meshnet_model import (run_simulation, SCENARIOS, SEED, N_TARGET,
-                           TOTAL_SUPPLY, RESULTS_DIR)
+                           TOTAL_SUPPLY, RESULTS_DIR, CAL_PATH)
+import meshnet_model as mm
+from numba_compat import njit, prange
 
 EXPONENTS = [0.5, 1.0, 1.5, 2.0, 3.0]
+AGENTS_CACHE = "bull_pid_final_agents.npz"
+# Reporting precision, applied once to the results table
+METRIC_DECIMALS = {"gini": 4, "hhi": 6, "top1_pct_share": 2,
+                   "top10_pct_share": 2, "whale_20pct_power_share": 2}
+
+
+def voting_powers(tau, R):
+    """Voting power under every formula at once, shape (len(EXPONENTS) + 1, N).
+    Rows follow EXPONENTS; the last row is the logarithmic formula."""
+    base = 1 + R
+    # sqrt and products instead of libm pow for the sweep's exponents;
+    # any other exponent falls back to np.power
+    root = np.sqrt(base)
+    sq = base * base
+    fast = {0.5: root, 1.0: base, 1.5: base * root, 2.0: sq, 3.0: sq * base}
+    rows = [tau * (fast[p] if p in fast else np.power(base, p)) for p in EXPONENTS]
+    rows.append(tau * (1 + np.log1p(R)))
+    return np.stack(rows)
+
+
+@njit(cache=True, parallel=True)
+def _power_metrics(powers, top1_count, top10_count):
+    """Fused per-row kernel: one sort, then a single pass accumulating the
+    total, Σv², the Gini rank sum and both top-k tails. Rows (formulas) are
+    independent and run in parallel.
+    Returns (formulas, 5): total, Gini, HHI, top-1% share, top-10% share."""
+    k, n = powers.shape
+    out = np.empty((k, 5))
+    for r in prange(k):
+        # Sort the (possibly float32) row, accumulate in float64 on both the
+        # JIT and the pure-Python fallback
+        v = np.sort(powers[r]).astype(np.float64)
+        total = 0.0
+        sq = 0.0
+        ranked = 0.0
+        top1 = 0.0
+        top10 = 0.0
+        for i in range(n):
+            x = v[i]
+            total += x
+            sq += x * x
+            ranked += (2 * (i + 1) - n - 1) * x
+            if i >= n - top10_count:
+                top10 += x
+                if i >= n - top1_count:
+                    top1 += x
+        out[r, 0] = total
+        if total == 0:
+            out[r, 1:] = np.nan
+            continue
+        # Gini: Σ(2i − n − 1)·v_i / (n·Σv) over ascending v
+        out[r, 1] = ranked / (n * total)
+        out[r, 2] = sq / (total * total)
+        out[r, 3] = top1 / total
+        out[r, 4] = top10 / total
+    return out
+
+
+def compute_governance_metrics(powers, whale_tokens):
+    """Compute Gini, HHI, top-1%, top-10%, whale test for each voting power formula.
+    powers is (formulas, N) from voting_powers; whale_tokens is the test whale's
+    stake. Returns one metrics dict per row, unrounded
+    (see METRIC_DECIMALS)."""
+    k, n = powers.shape
+    if not n:
+        return [{} for _ in range(k)]
 
-
-def compute_governance_metrics(agents, exponent=None, use_log=False):
-    """Compute Gini, HHI, top-1%, top-10%, whale test for a given voting power formula."""
-    active = [a for a in agents if a["active"]]
-    if not active:
-        return {}
-
-    # Compute voting power
-    powers = []
-    for a in active:
-        tau = a["stake"]
-        R = a["reputation"]
-        if use_log:
-            v = tau * (1 + np.log(1 + R))
-        else:
-            v = tau * (1 + R) ** exponent
-        powers.append(v)
-
-    powers = np.array(powers, dtype=float)
-    total_power = powers.sum()
-    if total_power == 0:
-        return {}
-
-    shares = powers / total_power
-    n = len(shares)
-
-    # Gini coefficient
-    sorted_shares = np.sort(shares)
-    cumulative = np.cumsum(sorted_shares)
-    gini = 1 - 2 * np.sum(cumulative) / n + 1 / n
-
-    # HHI
-    hhi = float(np.sum(shares ** 2))
-
-    # Top-1% and top-10% share
-    sorted_desc = np.sort(shares)[::-1]
     top1_count = max(1, int(np.ceil(n * 0.01)))
     top10_count = max(1, int(np.ceil(n * 0.10)))
-    top1_share = float(sorted_desc[:top1_count].sum())
-    top10_share = float(sorted_desc[:top10_count].sum())
+    stats = _power_metrics(np.ascontiguousarray(powers), top1_count, top10_count)
+    total_power, gini, hhi, top1_share, top10_share = stats.T
 
     # Whale test: entity with 20% of total supply and R=0
-    whale_tokens = int(TOTAL_SUPPLY * 0.20)
-    if use_log:
-        whale_power = whale_tokens * (1 + np.log(1 + 0))
-    else:
-        whale_power = whale_tokens * (1 + 0) ** exponent
+    # With R=0 every formula reduces to τ: (1+0)^p = 1 and 1 + log(1) = 1
+    whale_power = float(whale_tokens)
     whale_share = whale_power / (total_power + whale_power)
 
-    return {
-        "gini": round(gini, 4),
-        "hhi": round(hhi, 6),
-        "top1_pct_share": round(top1_share * 100, 2),
-        "top10_pct_share": round(top10_share * 100, 2),
-        "whale_20pct_power_share": round(whale_share * 100, 2),
-        "n_active": n,
-    }
+    return [
+        {
+            "gini": float(gini[i]),
+            "hhi": float(hhi[i]),
+            "top1_pct_share": float(top1_share[i]) * 100,
+            "top10_pct_share": float(top10_share[i]) * 100,
+            "whale_20pct_power_share": float(whale_share[i]) * 100,
+            "n_active": n,
+        } if total_power[i] != 0 else {}
+        for i in range(k)
+    ]
+
+
+def _simulate_bull_pid():
+    """Re-run bull/PID and return the final operator arrays and token price."""
+    records, ops = run_simulation("bull", SCENARIOS["bull"], True, SEED,
+                                  return_final_agents=True)
+    return ops, records[-1]["P"]
+
+
+def final_population(use_cache=True):
+    """Final bull/PID operator arrays and price. Cached as .npz in RESULTS_DIR;
+    the cache is reused while newer than the model code and calibration."""
+    cache = RESULTS_DIR / AGENTS_CACHE
+    deps = [Path(mm.__file__), CAL_PATH]
+    fresh = (use_cache and cache.exists() and
+             cache.stat().st_mtime >= max(d.stat().st_mtime for d in deps if d.exists()))
+    if fresh:
+        print(f"  Loading cached operator population: {cache.name}")
+        with np.load(cache) as d:
+            return {k: d[k] for k in ("stake", "reputation", "active")}, float(d["P"])
+
+    print("\nRunning bull/PID simulation to extract operator population...")
+    ops, P = _simulate_bull_pid()
+    np.savez(cache, P=P, **ops)
+    return ops, P
+
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Governance voting power exponent sweep")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="re-run bull/PID even if the cached final population is fresh")
+    args = parser.parse_args(argv)
 
-def main():
     print("=" * 60)
     print("GOVERNANCE EXPONENT SWEEP (ANALYTICAL)")
     print("=" * 60)
 
-    # Run bull/PID to get final operator population
-    print("\nRunning bull/PID simulation to extract operator population...")
-    scenario = SCENARIOS["bull"]
-    seed = SEED  # bull is first scenario
-
-    # We need access to the agents, so we'll re-run the sim and capture agents
-    from meshnet_model import (create_operators, create_whales, compute_demand,
-                                pid_emission, static_emission, burn_tokens,
-                                update_operators, update_reputation, update_price,
-                                TIMESTEPS, BASE_EMISSION, PID_CADENCE,
-                                KP_NORM, KI_NORM, KD_NORM)
-
-    rng = np.random.default_rng(seed)
-    C, T, N, F_daily, P = 200_000_000, 150_000_000, 2_000, 500.0, 0.10
-    E, B = BASE_EMISSION, 0.0
-    integral, prev_error = 0.0, 0.0
-    slashed_total, fraud_total, cost_mult = 0, 0.0, 1.0
-    agents = create_operators(N, rng)
-    whales = create_whales(rng)
-
-    for t in range(TIMESTEPS):
-        F_daily = compute_demand(t, N, P, scenario, rng, cost_mult)
-        result = pid_emission(N, integral, prev_error, t)
-        if result[0] is not None:
-            E, integral, prev_error = result
-        B = burn_tokens(F_daily, P)
-        agents, slashed, fraud, treas_subsidy = update_operators(
-            agents, E, F_daily, N, P, scenario, t, rng, T, cost_mult)
-        slashed_total += slashed
-        agents = update_reputation(agents, t)
-        P = update_price(P, F_daily, C, scenario.get("price_drift", 0), rng)
-        C = max(0, min(TOTAL_SUPPLY, C + E - B - slashed))
-        T = max(0, T + slashed - treas_subsidy)
-        N = max(1, sum(1 for a in agents if a["active"]))
-
-    active_count = sum(1 for a in agents if a["active"])
-    print(f"  Final bull/PID: N={active_count}, P=${P:.4f}")
-
-    # Compute governance metrics for each exponent
-    results = []
-    for p in EXPONENTS:
-        metrics = compute_governance_metrics(agents, exponent=p)
+    # Final population as struct-of-arrays; governance counts active operators only
+    ops, P = final_population(use_cache=not args.no_cache)
+    # float32 inputs halve the bytes sorted; the kernel accumulates in float64
+    tau = ops["stake"][ops["active"]].astype(np.float32)
+    R = ops["reputation"][ops["active"]].astype(np.float32)
+    print(f"  Final bull/PID: N={tau.size}, P=${P:.4f}")
+
+    # Compute governance metrics for every formula in one batched pass
+    whale_tokens = int(TOTAL_SUPPLY * 0.20)
+    results = compute_governance_metrics(voting_powers(tau, R), whale_tokens)
+    for metrics, p in zip(results, EXPONENTS + ["log"]):
         metrics["exponent"] = p
-        metrics["formula"] = f"τ × (1+R)^{p}"
-        results.append(metrics)
-        print(f"\n  p={p}: Gini={metrics['gini']:.4f}, HHI={metrics['hhi']:.6f}, "
-              f"Top-1%={metrics['top1_pct_share']:.1f}%, "
-              f"Whale(20%,R=0)={metrics['whale_20pct_power_share']:.1f}%")
-
-    # Logarithmic formula
-    log_metrics = compute_governance_metrics(agents, use_log=True)
-    log_metrics["exponent"] = "log"
-    log_metrics["formula"] = "τ × (1 + log(1+R))"
-    results.append(log_metrics)
-    print(f"\n  log: Gini={log_metrics['gini']:.4f}, HHI={log_metrics['hhi']:.6f}, "
-          f"Top-1%={log_metrics['top1_pct_share']:.1f}%, "
-          f"Whale(20%,R=0)={log_metrics['whale_20pct_power_share']:.1f}%")
-
-    df = pd.DataFrame(results)
+        metrics["formula"] = "τ × (1 + log(1+R))" if p == "log" else f"τ × (1+R)^{p}"
+
+    df = pd.DataFrame(results).round(METRIC_DECIMALS)
+    for _, row in df.iterrows():
+        label = "log" if row["exponent"] == "log" else f"p={row['exponent']}"
+        print(f"\n  {label}: Gini={row['gini']:.4f}, HHI={row['hhi']:.6f}, "
+              f"Top-1%={row['top1_pct_share']:.1f}%, "
+              f"Whale(20%,R=0)={row['whale_20pct_power_share']:.1f}%")
+
     out = RESULTS_DIR / "exponent_sensitivity_results.csv"
     df.to_csv(out, index=False)
     print(f"\nSaved: {out} ({len(df)} rows)")
@@ -18,10 +18,31 @@ from exhibit_style import (
 ROOT = Path(__file__).resolve().parent.parent
 setup_style()
 
-ms = pd.read_csv(ROOT / "results" / "multi_seed_results.csv")
-comp = ms[ms['scenario'] == 'competitor']
-pid = comp[comp['emission_model'] == 'pid']
-static = comp[comp['emission_model'] == 'static']
+
+def box_stats(data, q, whis=1.5):
+    """Box-plot stats for ax.bxp from precomputed quantiles (p5, Q1, median, Q3, max).
+    Whiskers and fliers follow matplotlib's boxplot_stats (Tukey, whis × IQR)."""
+    _, q1, med, q3, _ = q
+    iqr = q3 - q1
+    inside = data[(data >= q1 - whis * iqr) & (data <= q3 + whis * iqr)]
+    whislo = min(inside.min(), q1) if inside.size else q1
+    whishi = max(inside.max(), q3) if inside.size else q3
+    return {
+        "q1": q1, "med": med, "q3": q3,
+        "whislo": whislo, "whishi": whishi,
+        "fliers": np.concatenate([data[data < whislo], data[data > whishi]]),
+    }
+
+
+ms = pd.read_csv(
+    ROOT / "results" / "multi_seed_results.csv",
+    usecols=["scenario", "emission_model", "final_N", "final_P"],
+    dtype={"scenario": "category", "emission_model": "category",
+           "final_N": np.int32, "final_P": np.float64},
+)
+models = ms[ms['scenario'] == 'competitor'].groupby('emission_model', sort=False, observed=True)
+pid = models.get_group('pid')
+static = models.get_group('static')
 
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4.5))
 fig.suptitle("Ensemble Distributions Under Competitor Entry (30 Seeds per Model)",
@@ -40,8 +61,13 @@ for ax, col, label, fmt_p5, yscale, target in [
     pid_data = pid[col].values
     static_data = static[col].values
 
-    bp = ax.boxplot(
-        [pid_data, static_data], positions=[0, 1], widths=0.5,
+    # p5, Q1, median, Q3 and max per model from a single quantile call each
+    quantiles = np.array([np.quantile(d, [0.05, 0.25, 0.5, 0.75, 1.0])
+                          for d in (pid_data, static_data)])
+
+    bp = ax.bxp(
+        [box_stats(d, q) for d, q in zip((pid_data, static_data), quantiles)],
+        positions=[0, 1], widths=0.5,
         patch_artist=True, showfliers=True,
         flierprops=dict(marker='o', markersize=4, alpha=0.4),
         whiskerprops=dict(linewidth=1.5),
@@ -68,10 +94,7 @@ for ax, col, label, fmt_p5, yscale, target in [
     # When median==Q3 the white median hides the box top border.
     # Redraw box top edge + stub whisker + cap on top of everything.
     box_width = 0.5
-    for i, data in enumerate([pid_data, static_data]):
-        q3 = np.percentile(data, 75)
-        med = np.median(data)
-        dmax = data.max()
+    for i, (p5, q1, med, q3, dmax) in enumerate(quantiles):
         pos = [0, 1][i]
         half_bw = box_width / 2
         # If median sits at Q3, redraw the box top border above the white line
@@ -96,10 +119,12 @@ for ax, col, label, fmt_p5, yscale, target in [
     else:
         ax.set_ylim(auto=True)
 
-    pid_cv = np.std(pid_data, ddof=1) / pid_data.mean() if pid_data.mean() > 0 else 0
-    static_cv = np.std(static_data, ddof=1) / static_data.mean() if static_data.mean() > 0 else 0
-    pid_p5 = np.percentile(pid_data, 5)
-    static_p5 = np.percentile(static_data, 5)
+    # CV (ddof=1) for both models
+    means = np.array([d.mean() for d in (pid_data, static_data)])
+    stds = np.array([d.std(ddof=1) for d in (pid_data, static_data)])
+    cvs = np.divide(stds, means, out=np.zeros(2), where=means > 0)
+    pid_cv, static_cv = cvs
+    pid_p5, static_p5 = quantiles[:, 0]
 
     ax.set_xticks([0, 1])
     ax.set_xticklabels([
@@ -119,14 +144,14 @@ for ax, col, label, fmt_p5, yscale, target in [
 
     # Check against targets
     t = TARGETS[col]
-    for name, computed, expected in [
-        ('PID CV', pid_cv, t['pid_cv']),
-        ('PID p5', pid_p5, t['pid_p5']),
-        ('Static CV', static_cv, t['static_cv']),
-        ('Static p5', static_p5, t['static_p5']),
-    ]:
-        if expected != 0 and abs(computed - expected) / abs(expected) > 0.05:
-            print(f"  WARNING: {label} {name} = {computed:.4f}, expected ~{expected}")
+    names = np.array(['PID CV', 'PID p5', 'Static CV', 'Static p5'])
+    computed = np.array([pid_cv, pid_p5, static_cv, static_p5])
+    expected = np.array([t['pid_cv'], t['pid_p5'], t['static_cv'], t['static_p5']], dtype=float)
+    rel_err = np.divide(np.abs(computed - expected), np.abs(expected),
+                        out=np.zeros_like(expected), where=expected != 0)
+    bad = rel_err > 0.05
+    for name, c, e in zip(names[bad], computed[bad], expected[bad]):
+        print(f"  WARNING: {label} {name} = {c:.4f}, expected ~{e:g}")
 
 fig.tight_layout(rect=[0, 0.04, 1, 0.93])
 add_source(fig, "Source: MeshNet 240-run ensemble (30 seeds \u00d7 8 configurations). "
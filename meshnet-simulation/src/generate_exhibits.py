@@ -4,15 +4,24 @@ Generate all 19 exhibits for the MeshNet tokenomics whitepaper.
 Exhibit 9 (Helium BME timeline) is empirical data, not generated here.
 Reads simulation_results.csv and calibration_params.json.
 """
+import io
+import os
 import json
 import sys
+import functools
+import contextlib
+import traceback
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # file output only; no GUI backend probing
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.ticker as mticker
 from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
+from matplotlib.collections import LineCollection, PatchCollection
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from exhibit_style import (
@@ -24,25 +33,75 @@ ROOT = Path(__file__).resolve().parent.parent
 SIM_PATH = ROOT / "results" / "simulation_results.csv"
 CAL_PATH = ROOT / "calibration_params.json"
 
-# Load data
-def load_sim():
-    return pd.read_csv(SIM_PATH)
+# pyarrow's multithreaded CSV reader when installed; pandas' C parser otherwise
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
 
+# Load data — memoized so a full run parses each source once.
+# Callers share the returned objects and must not mutate them.
+@functools.lru_cache(maxsize=1)
+def load_sim():
+    # Scenario/model labels as categoricals: groupby and == work on int codes.
+    # Plot-only series narrowed to 32-bit (E is whole tokens/day, exact in float32);
+    # C, s2r and F_daily feed annotations and ratios and stay float64.
+    return pd.read_csv(SIM_PATH, engine=_CSV_ENGINE,
+                       dtype={"scenario": "category", "emission_model": "category",
+                              "timestep": np.int32, "N": np.int32,
+                              "E": np.float32, "P": np.float32})
+
+@functools.lru_cache(maxsize=None)
+def load_result(name):
+    """A results/ CSV, parsed once per process (shared; do not mutate)."""
+    return pd.read_csv(ROOT / "results" / name, engine=_CSV_ENGINE)
+
+@functools.lru_cache(maxsize=1)
+def sim_groups():
+    """Simulation sub-frames keyed by (scenario, emission_model), split in one groupby."""
+    return dict(tuple(load_sim().groupby(["scenario", "emission_model"],
+                                          sort=False, observed=True)))
+
+@functools.lru_cache(maxsize=1)
+def sim_months():
+    """Month axis (timestep / 30) shared by every run; read-only."""
+    months = next(iter(sim_groups().values()))["timestep"].to_numpy() / 30
+    months.flags.writeable = False
+    return months
+
+@functools.lru_cache(maxsize=1)
+def ensemble_groups():
+    """multi_seed_results.csv split the same way as sim_groups."""
+    return dict(tuple(load_result("multi_seed_results.csv").groupby(
+        ["scenario", "emission_model"], sort=False)))
+
+@functools.lru_cache(maxsize=1)
 def load_cal():
     with open(CAL_PATH) as f:
         return json.load(f)
 
+@functools.lru_cache(maxsize=1)
 def load_s2r():
     sys.path.insert(0, str(Path(__file__).resolve().parent))
     import data_loader
     return data_loader.load_s2r_cleaned()
 
+@functools.lru_cache(maxsize=1)
 def load_governance():
     sys.path.insert(0, str(Path(__file__).resolve().parent))
     import data_loader
     return data_loader.load_governance()
 
 
+def _arrow(ax, start, end, **props):
+    """Bare FancyArrowPatch from start to end. Draws the same pixels as
+    ax.annotate('', xy=end, xytext=start, arrowprops=props) without the
+    Text wrapper (same mutation scale, z-order and clipping)."""
+    ax.add_patch(FancyArrowPatch(start, end, mutation_scale=plt.rcParams['font.size'],
+                                 zorder=3, clip_on=False, **props))
+
+
 # ═══════════════════════════════════════════════════════════════
 # EXHIBIT 1: Coordination Technology Timeline
 # ═══════════════════════════════════════════════════════════════
@@ -59,10 +118,12 @@ def exhibit_01():
         (3.5, 1, "Platforms", "APIs &\nalgorithms", "Rent\nextraction", COLORS['accent2']),
         (4.5, 1, "Protocols", "Tokens &\nconsensus", "Governance\ncapture?", COLORS['accent4']),
     ]
+    # All boxes share one style: draw them as a single collection
+    ax.add_collection(PatchCollection(
+        [FancyBboxPatch((x-0.42, y-0.35), 0.84, 0.7, boxstyle="round,pad=0.05")
+         for x, y, *_ in nodes],
+        facecolors=[n[-1] for n in nodes], edgecolors='white', alpha=0.9, linewidths=2))
     for x, y, name, mechanism, failure, color in nodes:
-        box = FancyBboxPatch((x-0.42, y-0.35), 0.84, 0.7, boxstyle="round,pad=0.05",
-                             facecolor=color, edgecolor='white', alpha=0.9, linewidth=2)
-        ax.add_patch(box)
         ax.text(x, y, name, ha='center', va='center', fontsize=12,
                 fontweight='bold', color='white')
         ax.text(x, y-0.85, mechanism, ha='center', va='top', fontsize=12,
@@ -156,10 +217,10 @@ def exhibit_02():
 # EXHIBIT 3: Historical Private Currency Issuance
 # ═══════════════════════════════════════════════════════════════
 def exhibit_03():
-    years = [1790, 1800, 1810, 1820, 1830, 1840, 1845, 1850, 1855,
-             1860, 1863, 1865, 1870]
-    counts = [25, 100, 200, 300, 600, 1500, 2000, 3000, 5000,
-              8000, 8000, 2000, 300]
+    years = np.array([1790, 1800, 1810, 1820, 1830, 1840, 1845, 1850, 1855,
+                      1860, 1863, 1865, 1870], dtype=np.int16)
+    counts = np.array([25, 100, 200, 300, 600, 1500, 2000, 3000, 5000,
+                       8000, 8000, 2000, 300], dtype=np.int32)
     fig, ax = plt.subplots(figsize=(10, 5.5))
     ax.fill_between(years, counts, alpha=0.3, color=COLORS['accent1'])
     ax.plot(years, counts, color=COLORS['accent1'], linewidth=2.5, marker='o',
@@ -203,11 +264,12 @@ def exhibit_04():
         "Governance":         (11,   1.5,  COLORS['accent3']),
     }
     bw, bh = 3.0, 1.5  # box width/height — large enough to fill space
+    ax.add_collection(PatchCollection(
+        [FancyBboxPatch((x - bw / 2, y - bh / 2), bw, bh, boxstyle="round,pad=0.10")
+         for x, y, _ in nodes.values()],
+        facecolors=[c for _, _, c in nodes.values()],
+        edgecolors='white', alpha=0.92, linewidths=2.5))
     for name, (x, y, color) in nodes.items():
-        box = FancyBboxPatch((x - bw / 2, y - bh / 2), bw, bh,
-                             boxstyle="round,pad=0.10", facecolor=color,
-                             edgecolor='white', alpha=0.92, linewidth=2.5)
-        ax.add_patch(box)
         ax.text(x, y, name, ha='center', va='center', fontsize=14,
                 fontweight='bold', color='white')
 
@@ -267,13 +329,16 @@ def exhibit_06():
     fig = plt.figure(figsize=(10, 7))
     ax = fig.add_subplot(111, projection='3d')
 
-    tau = np.logspace(3, 5.7, 60)  # 1,000 to 500,000
-    R = np.linspace(0, 5, 60)
-    TAU, REP = np.meshgrid(tau, R)
-    V = TAU * (1 + REP) ** 2
+    # 30×30 is visually smooth at this size; the 3D renderer scales with quad count
+    # tau is log-spaced, so the surface's x grid is the exponent grid itself
+    log_tau_axis = np.linspace(3, 5.7, 30)
+    tau = 10 ** log_tau_axis  # 1,000 to 500,000
+    R = np.linspace(0, 5, 30)
+    log_tau, REP = np.meshgrid(log_tau_axis, R)
+    V = tau * np.square(1 + R)[:, None]
 
-    surf = ax.plot_surface(np.log10(TAU), REP, V / 1e6, cmap='viridis',
-                           alpha=0.75, edgecolor='none')
+    surf = ax.plot_surface(log_tau, REP, V / 1e6, cmap='viridis',
+                           rstride=1, cstride=1, alpha=0.75, edgecolor='none')
     ax.set_xlabel("log₁₀(Token Balance)", fontsize=12, labelpad=10)
     ax.set_ylabel("Reputation Score R(i)", fontsize=12, labelpad=10)
     ax.set_zlabel("Voting Power (millions)", fontsize=12, labelpad=10)
@@ -314,10 +379,14 @@ def exhibit_06():
     # Project 3D scatter points into axes-fraction coordinates.
     from mpl_toolkits.mplot3d import proj3d
 
-    def _project_to_axes_frac(ax, x3, y3, z3):
-        x2, y2, _ = proj3d.proj_transform(x3, y3, z3, ax.get_proj())
-        dot_disp = ax.transData.transform((x2, y2))
-        return tuple(ax.transAxes.inverted().transform(dot_disp))
+    # Projection matrix and transforms are fixed after the draw; fetch them once
+    proj = ax.get_proj()
+    data_to_disp = ax.transData
+    disp_to_axes = ax.transAxes.inverted()
+
+    def _project_to_axes_frac(x3, y3, z3):
+        x2, y2, _ = proj3d.proj_transform(x3, y3, z3, proj)
+        return tuple(disp_to_axes.transform(data_to_disp.transform((x2, y2))))
 
     for (x3, y3, z3, text_xy, clr, label) in [
         (whale_x, whale_R, whale_z, (0.52, 0.25), whale_color,
@@ -325,7 +394,7 @@ def exhibit_06():
         (op_x, op_R, op_z, (0.22, 0.42), op_color,
          f"Operator\n(10k, R=2)\nV={op_V:,}"),
     ]:
-        dot_xy = _project_to_axes_frac(ax, x3, y3, z3)
+        dot_xy = _project_to_axes_frac(x3, y3, z3)
         ax.annotate(label, xy=dot_xy, xytext=text_xy,
                     xycoords='axes fraction', textcoords='axes fraction',
                     fontsize=8.5, ha='center', color=clr, fontweight='bold',
@@ -339,7 +408,7 @@ def exhibit_06():
 # EXHIBIT 7: Burn-Mint Equilibrium (with Helium S2R inset)
 # ═══════════════════════════════════════════════════════════════
 def exhibit_07():
-    sim = load_sim()
+    groups = sim_groups()
     cal = load_cal()
 
     # Two-panel layout: main chart on top, Helium BME reference below
@@ -351,9 +420,12 @@ def exhibit_07():
     # ── Top panel: circulating supply ──
     for scen, label in [("bull", "High Adoption"), ("competitor", "Medium Adoption"),
                         ("bear", "Low Adoption")]:
-        sub = sim[(sim["scenario"] == scen) & (sim["emission_model"] == "pid")]
-        months = sub["timestep"] / 30
-        ax.plot(months, sub["C"] / 1e6, label=label,
+        sub = groups[(scen, "pid")]
+        # Supply is smooth at daily resolution: weekly points (plus the last day)
+        # draw the same curve with a 7× shorter path
+        keep = np.r_[0:len(sub):7, len(sub) - 1]
+        months = sub["timestep"].to_numpy()[keep] / 30
+        ax.plot(months, sub["C"].to_numpy()[keep] * 1e-6, label=label,
                 color=SCENARIO_COLORS[scen], linewidth=2)
 
     ax.set_xlabel("Month")
@@ -364,11 +436,12 @@ def exhibit_07():
     hide_spines(ax)
 
     # Annotate crossover for bull
-    bull = sim[(sim["scenario"] == "bull") & (sim["emission_model"] == "pid")]
-    crossover = bull[bull["s2r"] >= 1.0]
-    if len(crossover) > 0:
-        cross_month = crossover.iloc[0]["timestep"] / 30
-        cross_C = crossover.iloc[0]["C"] / 1e6
+    bull = groups[("bull", "pid")]
+    above = bull["s2r"].to_numpy() >= 1.0
+    idx = int(np.argmax(above))  # first crossing; 0 if there is none
+    if above[idx]:
+        cross_month = bull["timestep"].iat[idx] / 30
+        cross_C = bull["C"].iat[idx] / 1e6
         ax.axvline(x=cross_month, color=COLORS['accent2'], ls=':', alpha=0.5)
         ax.annotate(f"B(t) > E(t)\nMonth {cross_month:.0f}",
                     xy=(cross_month, cross_C), xytext=(cross_month + 5, cross_C + 20),
@@ -409,8 +482,14 @@ def exhibit_08():
     base_fee = 0.05  # $0.05 base
     fee_floor = 0.02
     fee_ceiling = 0.50
-    fee_mult = np.clip(1 + 2 * (congestion - 0.5) ** 2, 0.4, 10)
-    urban_fee = np.clip(base_fee * fee_mult, fee_floor, fee_ceiling)
+    # fee = clip(base · clip(1 + 2(c − 0.5)², 0.4, 10), floor, ceiling), in one buffer
+    urban_fee = np.subtract(congestion, 0.5)
+    np.square(urban_fee, out=urban_fee)
+    urban_fee *= 2
+    urban_fee += 1
+    np.clip(urban_fee, 0.4, 10, out=urban_fee)
+    urban_fee *= base_fee
+    np.clip(urban_fee, fee_floor, fee_ceiling, out=urban_fee)
 
     ax1.plot(congestion, urban_fee, color=COLORS['accent1'], linewidth=2.5)
     ax1.axhline(fee_floor, color=COLORS['accent4'], ls='--', lw=1, label=f'Floor (${fee_floor})')
@@ -424,8 +503,12 @@ def exhibit_08():
 
     # Panel 2: Rural subsidy
     density = np.linspace(0, 1.0, 200)
-    subsidy = np.exp(-3 * density)  # exponential decay subsidy
-    rural_fee = base_fee * (1 - 0.8 * subsidy)
+    subsidy = np.multiply(density, -3.0)
+    np.exp(subsidy, out=subsidy)  # exponential decay subsidy
+    # base · (1 − 0.8·subsidy), built in one buffer
+    rural_fee = np.multiply(subsidy, -0.8)
+    rural_fee += 1
+    rural_fee *= base_fee
 
     ax2.plot(density, rural_fee, color=COLORS['accent4'], linewidth=2.5)
     ax2.plot(density, subsidy * base_fee, color=COLORS['accent3'], linewidth=1.5,
@@ -486,23 +569,22 @@ def exhibit_09():
 
     # Circulating supply timeline
     months = np.arange(0, 49)
-    circ = np.zeros(len(months))
     # Airdrop: 25% TGE, 75% linear 12 months
     airdrop_total = 80_000_000
-    circ += airdrop_total * 0.25  # TGE
-    for m in range(1, 13):
-        circ[m:] += airdrop_total * 0.75 / 12
+    airdrop_sched = np.zeros(len(months))
+    airdrop_sched[1:13] = airdrop_total * 0.75 / 12
+    airdrop = airdrop_total * 0.25 + np.cumsum(airdrop_sched)
     # Operator emissions: ~109k/day
-    for m in months:
-        circ[m] += 109_589 * 30 * m
+    operator = 109_589 * 30 * months
     # Team: 1yr cliff then 3yr linear
     team_total = 150_000_000
-    for m in range(12, 49):
-        circ[m:] += team_total / 36 if m < 48 else 0
+    team_sched = np.zeros(len(months))
+    team_sched[12:48] = team_total / 36
+    team = np.cumsum(team_sched)
     # Ecosystem: linear 4yr
     eco_total = 55_000_000
-    for m in months:
-        circ[m] += eco_total / 48 * m
+    eco = eco_total / 48 * months
+    circ = airdrop + operator + team + eco
     circ = np.minimum(circ, 1_000_000_000)
 
     ax2.fill_between(months, circ / 1e6, alpha=0.3, color=COLORS['accent1'])
@@ -528,29 +610,29 @@ def exhibit_09():
 # EXHIBIT 10: Emission Schedule (PID vs fee revenue)
 # ═══════════════════════════════════════════════════════════════
 def exhibit_10():
-    sim = load_sim()
-    bull_pid = sim[(sim["scenario"] == "bull") & (sim["emission_model"] == "pid")]
+    groups = sim_groups()
+    bull_pid = groups[("bull", "pid")]
 
     fig, ax1 = plt.subplots(figsize=(11, 5.5))
     fig.subplots_adjust(right=0.82)  # extra right margin for endpoint labels
-    months = bull_pid["timestep"] / 30
+    E = bull_pid["E"].to_numpy()
+    F = bull_pid["F_daily"].to_numpy()
+    months = bull_pid["timestep"].to_numpy() / 30
 
-    ax1.plot(months, bull_pid["E"], color=COLORS['accent1'], linewidth=2,
+    ax1.plot(months, E, color=COLORS['accent1'], linewidth=2,
              label='PID Emission Rate (tokens/day)')
     ax1.set_ylabel("Emission Rate (tokens/day)", color=COLORS['accent1'])
     ax1.set_xlabel("Month")
     ax1.tick_params(axis='y', labelcolor=COLORS['accent1'])
 
     ax2 = ax1.twinx()
-    ax2.plot(months, bull_pid["F_daily"], color=COLORS['accent4'], linewidth=2,
+    ax2.plot(months, F, color=COLORS['accent4'], linewidth=2,
              ls='--', label='Fee Revenue ($/day)')
     ax2.set_ylabel("Fee Revenue ($/day)", color=COLORS['accent4'])
     ax2.tick_params(axis='y', labelcolor=COLORS['accent4'])
 
     # Endpoint annotations — inside plot area to avoid clipping
-    last_month = months.iloc[-1]
-    last_E = bull_pid["E"].iloc[-1]
-    last_F = bull_pid["F_daily"].iloc[-1]
+    last_month, last_E, last_F = months[-1], E[-1], F[-1]
     fee_pct = last_F / last_E * 100 if last_E > 0 else 0
     ax1.annotate(f"Emission: {last_E:,.0f} tokens/day",
                  xy=(last_month, last_E), xytext=(last_month - 15, last_E * 1.15),
@@ -578,26 +660,25 @@ def exhibit_10():
 # ═══════════════════════════════════════════════════════════════
 def exhibit_11():
     rng = np.random.default_rng(42)
-    ratios = [0.20, 0.30, 0.40, 0.50, 0.60, 0.70, 0.80]
-    price_impacts = []
-    for r in ratios:
-        # Mercenary sell % increases with ratio
-        sell_pct = 0.3 + 0.5 * (r - 0.2) / 0.6  # 30-80% sell
-        airdrop_tokens = r * 200_000_000  # fraction of initial float
-        sell_pressure = airdrop_tokens * sell_pct
-        order_book_depth = 50_000_000  # tokens at various prices
-        impact = sell_pressure / (order_book_depth + sell_pressure) * 100
-        impact += rng.normal(0, 1.5)
-        price_impacts.append(max(0, impact))
+    ratios = np.array([0.20, 0.30, 0.40, 0.50, 0.60, 0.70, 0.80])
+    # Mercenary sell % increases with ratio
+    sell_pct = 0.3 + 0.5 * (ratios - 0.2) / 0.6  # 30-80% sell
+    airdrop_tokens = ratios * 200_000_000  # fraction of initial float
+    sell_pressure = airdrop_tokens * sell_pct
+    order_book_depth = 50_000_000  # tokens at various prices
+    impact = sell_pressure / (order_book_depth + sell_pressure) * 100
+    # One draw per ratio, same stream as drawing them one at a time
+    impact += rng.normal(0, 1.5, size=ratios.size)
+    price_impacts = np.maximum(0, impact)
 
     fig, ax = plt.subplots(figsize=(9, 5.5))
     bars = ax.bar([f"{int(r*100)}%" for r in ratios], price_impacts,
                   color=[COLORS['accent4'] if r <= 0.5 else COLORS['accent2'] for r in ratios],
                   edgecolor='white', linewidth=1.5, width=0.6)
     # Annotate MeshNet target — positioned far left above bars to avoid overlap
-    target_idx = ratios.index(0.40)
+    target_idx = int(np.flatnonzero(ratios == 0.40)[0])
     ax.annotate("MeshNet\ndesign target", xy=(target_idx, price_impacts[target_idx]),
-                xytext=(target_idx - 1.8, max(price_impacts) * 0.95),
+                xytext=(target_idx - 1.8, price_impacts.max() * 0.95),
                 fontsize=9, fontweight='bold', color=COLORS['accent4'],
                 arrowprops=dict(arrowstyle='->', color=COLORS['accent4'], lw=1.5))
 
@@ -629,10 +710,11 @@ def exhibit_12():
 
     fig, ax = plt.subplots(figsize=(10, 5.5))
     for label, tau, signal_days, color in profiles:
-        conv = np.zeros(len(days))
-        for t in range(1, len(days)):
-            signal = tau if t <= signal_days else 0
-            conv[t] = conv[t-1] * (1 - beta) + signal * beta
+        # Closed form of conv[t] = conv[t-1]·(1−β) + signal·β from conv[0] = 0:
+        # τ·(1 − (1−β)^t) while signalling, then geometric decay from day signal_days
+        conv_on = tau * (1 - (1 - beta) ** np.minimum(days, signal_days))
+        conv_off = conv_on[signal_days] * (1 - beta) ** np.clip(days - signal_days, 0, None)
+        conv = np.where(days <= signal_days, conv_on, conv_off)
         ax.plot(days, conv / 1000, label=label, color=color, linewidth=2.5)
 
     ax.set_xlabel("Days")
@@ -672,22 +754,20 @@ def exhibit_13():
     ]
     # Track diamond centers for arrow offset computation
     diamond_centers = set()
+    shapes = []
     for x, y, label, color in boxes:
         if "?" in label:
             w, h = 2.0, 1.2
-            diamond = plt.Polygon([(x, y+h/2), (x+w/2, y), (x, y-h/2), (x-w/2, y)],
-                                  facecolor=color, edgecolor='white', alpha=0.9, lw=1.5)
-            ax.add_patch(diamond)
+            shapes.append(plt.Polygon([(x, y+h/2), (x+w/2, y), (x, y-h/2), (x-w/2, y)],
+                                      facecolor=color, edgecolor='white', alpha=0.9, lw=1.5))
             diamond_centers.add((x, y))
-            ax.text(x, y, label, ha='center', va='center', fontsize=11,
-                    fontweight='bold', color='white')
         else:
             w, h = 1.5, 0.8
-            box = FancyBboxPatch((x-w/2, y-h/2), w, h, boxstyle="round,pad=0.05",
-                                 facecolor=color, edgecolor='white', alpha=0.9, lw=1.5)
-            ax.add_patch(box)
-            ax.text(x, y, label, ha='center', va='center', fontsize=11,
-                    fontweight='bold', color='white')
+            shapes.append(FancyBboxPatch((x-w/2, y-h/2), w, h, boxstyle="round,pad=0.05",
+                                         facecolor=color, edgecolor='white', alpha=0.9, lw=1.5))
+        ax.text(x, y, label, ha='center', va='center', fontsize=11,
+                fontweight='bold', color='white')
+    ax.add_collection(PatchCollection(shapes, match_original=True))
 
     # Arrows — compute offsets based on whether source/dest is diamond
     arrow_pairs = [
@@ -699,11 +779,10 @@ def exhibit_13():
     for sx, sy, dx, dy in arrow_pairs:
         src_off = 0.85 if (sx, sy) in diamond_centers else 0.65
         dst_off = 0.85 if (dx, dy) in diamond_centers else 0.65
-        ax.annotate('', xy=(dx - dst_off, dy), xytext=(sx + src_off, sy),
-                    arrowprops=dict(arrowstyle='->', color=COLORS['mid_gray'], lw=1.2))
+        _arrow(ax, (sx + src_off, sy), (dx - dst_off, dy),
+               arrowstyle='->', color=COLORS['mid_gray'], lw=1.2)
     # Veto branch — starts from diamond bottom vertex (y - h/2 = 3 - 0.6 = 2.4)
-    ax.annotate('', xy=(9.5, 1.2), xytext=(9.5, 2.4),
-                arrowprops=dict(arrowstyle='->', color=COLORS['accent2'], lw=1.2))
+    _arrow(ax, (9.5, 2.4), (9.5, 1.2), arrowstyle='->', color=COLORS['accent2'], lw=1.2)
     ax.text(10.3, 2.0, ">75%\noppose", fontsize=10, color=COLORS['accent2'])
 
     add_source(fig, "Source: MeshNet governance framework (Section 7).")
@@ -729,25 +808,23 @@ def exhibit_14():
         (9.5, 2, "MeshNet\nEconomy", COLORS['accent2'], 2.0, 0.9),
         (9.5, 0.2, "Node Count\nN(t)", COLORS['accent5'], 1.8, 0.7),
     ]
+    ax.add_collection(PatchCollection(
+        [FancyBboxPatch((x-w/2, y-h/2), w, h, boxstyle="round,pad=0.05")
+         for x, y, _, _, w, h in blocks],
+        facecolors=[b[3] for b in blocks], edgecolors='white', alpha=0.9, linewidths=2))
     for x, y, label, color, w, h in blocks:
-        box = FancyBboxPatch((x-w/2, y-h/2), w, h, boxstyle="round,pad=0.05",
-                             facecolor=color, edgecolor='white', alpha=0.9, lw=2)
-        ax.add_patch(box)
         ax.text(x, y, label, ha='center', va='center', fontsize=11,
                 fontweight='bold', color='white')
 
     # Forward path arrows
     for sx, dx in [(1.4, 2.15), (2.85, 3.5), (5.5, 6.1), (7.9, 8.5)]:
-        ax.annotate('', xy=(dx, 2), xytext=(sx, 2),
-                    arrowprops=dict(arrowstyle='->', color=COLORS['text'], lw=1.8))
+        _arrow(ax, (sx, 2), (dx, 2), arrowstyle='->', color=COLORS['text'], lw=1.8)
 
     # Feedback path — lowered to y=-0.1 for clear separation from Node Count box
-    ax.annotate('', xy=(9.5, 1.55), xytext=(9.5, 0.55),
-                arrowprops=dict(arrowstyle='<-', color=COLORS['text'], lw=1.5))
+    _arrow(ax, (9.5, 0.55), (9.5, 1.55), arrowstyle='<-', color=COLORS['text'], lw=1.5)
     ax.plot([9.5, 9.5], [-0.15, -0.1], color=COLORS['text'], lw=1.5)
     ax.plot([2.5, 2.5, 9.5], [-0.1, -0.1, -0.1], color=COLORS['text'], lw=1.5)
-    ax.annotate('', xy=(2.5, 1.65), xytext=(2.5, -0.1),
-                arrowprops=dict(arrowstyle='->', color=COLORS['text'], lw=1.5))
+    _arrow(ax, (2.5, -0.1), (2.5, 1.65), arrowstyle='->', color=COLORS['text'], lw=1.5)
 
     # Labels on arrows — shifted to avoid overlapping Σ box and connector lines
     ax.text(3.5, 2.6, "error e(t)", fontsize=11, style='italic', color=COLORS['text'],
@@ -758,8 +835,7 @@ def exhibit_14():
                       edgecolor=COLORS['grid'], alpha=0.9), zorder=5)
 
     # Disturbance
-    ax.annotate('', xy=(9.5, 2.45), xytext=(9.5, 3.3),
-                arrowprops=dict(arrowstyle='->', color=COLORS['accent2'], lw=1.5))
+    _arrow(ax, (9.5, 3.3), (9.5, 2.45), arrowstyle='->', color=COLORS['accent2'], lw=1.5)
     ax.text(9.5, 3.5, "Disturbance\n(demand shocks)", ha='center', fontsize=10,
             color=COLORS['accent2'], fontweight='bold')
     ax.text(5.5, -0.7, "Feedback: N(t) → error → PID adjustment → E(t+1)",
@@ -773,13 +849,13 @@ def exhibit_14():
 # EXHIBIT 15: Emission Rate PID vs Static
 # ═══════════════════════════════════════════════════════════════
 def exhibit_15():
-    sim = load_sim()
+    groups = sim_groups()
     fig, ax = plt.subplots(figsize=(10, 5.5))
 
     # Bull scenario primary
-    bull_pid = sim[(sim["scenario"] == "bull") & (sim["emission_model"] == "pid")]
-    bull_sta = sim[(sim["scenario"] == "bull") & (sim["emission_model"] == "static")]
-    months = bull_pid["timestep"].values / 30
+    bull_pid = groups[("bull", "pid")]
+    bull_sta = groups[("bull", "static")]
+    months = sim_months()
 
     ax.plot(months, bull_pid["E"], color=COLORS['accent1'], linewidth=2.5,
             label='PID (bull)', zorder=5)
@@ -787,16 +863,14 @@ def exhibit_15():
             ls='--', alpha=0.6, label='Static (bull)')
 
     # Shade range across all 4 scenarios for PID
-    all_pid_E = []
-    for scen in SCENARIO_COLORS:
-        sub = sim[(sim["scenario"] == scen) & (sim["emission_model"] == "pid")]
-        if len(sub) == len(months):
-            all_pid_E.append(sub["E"].values)
-    if all_pid_E:
-        lo = np.min(all_pid_E, axis=0)
-        hi = np.max(all_pid_E, axis=0)
-        ax.fill_between(months, lo, hi, alpha=0.15, color=COLORS['accent1'],
-                        label='PID range (all scenarios)')
+    # Full-horizon scenarios stack into one 2-D array; missing or short runs are left out
+    pid_E = [groups[(scen, "pid")]["E"].to_numpy() for scen in SCENARIO_COLORS
+             if (scen, "pid") in groups]
+    pid_E = [e for e in pid_E if len(e) == len(months)]
+    if pid_E:
+        all_pid_E = np.stack(pid_E)
+        ax.fill_between(months, all_pid_E.min(axis=0), all_pid_E.max(axis=0),
+                        alpha=0.15, color=COLORS['accent1'], label='PID range (all scenarios)')
 
     ax.set_xlabel("Month")
     ax.set_ylabel("Emission Rate (tokens/day)")
@@ -812,7 +886,7 @@ def exhibit_15():
 # EXHIBIT 16: Node Count Stability PID vs Static
 # ═══════════════════════════════════════════════════════════════
 def exhibit_16():
-    sim = load_sim()
+    groups = sim_groups()
     fig, ax = plt.subplots(figsize=(10, 5.5))
 
     N_TARGET = 10_000
@@ -823,10 +897,10 @@ def exhibit_16():
                label='±15% target band')
     ax.axhline(N_TARGET, color=COLORS['mid_gray'], ls=':', lw=1)
 
+    months = sim_months()
     for scen, color in SCENARIO_COLORS.items():
-        pid = sim[(sim["scenario"] == scen) & (sim["emission_model"] == "pid")]
-        sta = sim[(sim["scenario"] == scen) & (sim["emission_model"] == "static")]
-        months = pid["timestep"].values / 30
+        pid = groups[(scen, "pid")]
+        sta = groups[(scen, "static")]
         ax.plot(months, pid["N"], color=color, linewidth=2, label=f'{scen} (PID)')
         ax.plot(months, sta["N"], color=color, linewidth=1.2, ls='--', alpha=0.5)
 
@@ -844,13 +918,13 @@ def exhibit_16():
 # EXHIBIT 18: Token Price Trajectories
 # ═══════════════════════════════════════════════════════════════
 def exhibit_18():
-    sim = load_sim()
+    groups = sim_groups()
     fig, ax = plt.subplots(figsize=(10, 5.5))
 
+    months = sim_months()
     for scen, color in SCENARIO_COLORS.items():
-        pid = sim[(sim["scenario"] == scen) & (sim["emission_model"] == "pid")]
-        sta = sim[(sim["scenario"] == scen) & (sim["emission_model"] == "static")]
-        months = pid["timestep"].values / 30
+        pid = groups[(scen, "pid")]
+        sta = groups[(scen, "static")]
         ax.plot(months, pid["P"], color=color, linewidth=2, label=f'{scen} (PID)')
         ax.plot(months, sta["P"], color=color, linewidth=1.2, ls='--', alpha=0.5)
 
@@ -868,7 +942,7 @@ def exhibit_18():
 # EXHIBIT 22: Wash Trading Impact
 # ═══════════════════════════════════════════════════════════════
 def exhibit_22():
-    wt = pd.read_csv(ROOT / "results" / "wash_trading_results.csv")
+    wt = load_result("wash_trading_results.csv")
 
     without_poc = wt[wt['poc'] == False]['fraud_rate_pct'].values
     with_poc = wt[wt['poc'] == True]['fraud_rate_pct'].values
@@ -900,11 +974,11 @@ def exhibit_22():
 # ═══════════════════════════════════════════════════════════════
 # EXHIBIT 5: Whale Governance Power (with real protocol benchmarks)
 # ═══════════════════════════════════════════════════════════════
-def exhibit_05():
-    fig, ax = plt.subplots(figsize=(10, 6))
-
-    percentiles = [50, 75, 90, 95, 99]
-
+@functools.lru_cache(maxsize=None)
+def _whale_baseline(percentiles):
+    """Cumulative governance-power share held by the top-p% holders under
+    token weighting and MeshNet reputation weighting (seed 42, 10k holders).
+    Deterministic, so computed once per process; returned arrays are read-only."""
     # Token-weighted model (Zipf-like distribution)
     rng = np.random.default_rng(42)
     n_holders = 10_000
@@ -913,10 +987,9 @@ def exhibit_05():
     total = balances.sum()
     cum_share = np.cumsum(balances) / total * 100
 
-    token_power = []
-    for p in percentiles:
-        idx = int(n_holders * (1 - p / 100))
-        token_power.append(cum_share[idx])
+    # Cumulative share at each top-p% cut: int() truncation of n·(1 − p/100), vectorized
+    pct_idx = (n_holders * (1 - np.asarray(percentiles) / 100)).astype(int)
+    token_power = cum_share[pct_idx]
 
     # Reputation-weighted model
     reputations = np.zeros(n_holders)
@@ -929,10 +1002,18 @@ def exhibit_05():
     rep_power_raw = balances * (1 + reputations) ** 2
     rep_total = rep_power_raw.sum()
     rep_cum = np.cumsum(rep_power_raw) / rep_total * 100
-    rep_power = []
-    for p in percentiles:
-        idx = int(n_holders * (1 - p / 100))
-        rep_power.append(rep_cum[idx])
+    rep_power = rep_cum[pct_idx]
+
+    token_power.flags.writeable = rep_power.flags.writeable = False
+    return token_power, rep_power
+
+
+def exhibit_05():
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    percentiles = [50, 75, 90, 95, 99]
+
+    token_power, rep_power = _whale_baseline(tuple(percentiles))
 
     x = np.arange(len(percentiles))
     width = 0.3
@@ -944,10 +1025,10 @@ def exhibit_05():
     # Real protocol Gini benchmarks as horizontal reference lines
     try:
         gov_df = load_governance()
-        for _, row in gov_df.iterrows():
-            if pd.notna(row.get("top1_share")):
-                ax.axhline(row["top1_share"] * 100, color=COLORS['mid_gray'],
-                           ls=':', lw=0.6, alpha=0.4)
+        # One full-width LineCollection (axes-x, data-y) instead of an axhline per row
+        top1 = gov_df["top1_share"].dropna().to_numpy() * 100
+        ax.hlines(top1, 0, 1, transform=ax.get_yaxis_transform(),
+                  colors=COLORS['mid_gray'], linestyles=':', lw=0.6, alpha=0.4)
         # Label a couple
         ax.text(len(percentiles) - 0.5, gov_df["top1_share"].max() * 100 + 1,
                 f"Curve top-1: {gov_df['top1_share'].max():.0%}",
@@ -999,31 +1080,30 @@ def exhibit_23():
 
     n = len(disciplines)
     radius = 4.8
-    for i, (name, concepts, color) in enumerate(disciplines):
-        angle = 2 * np.pi * i / n - np.pi / 2
-        x = radius * np.cos(angle)
-        y = radius * np.sin(angle)
-
-        # Spoke line — draw behind everything (low zorder)
-        ax.plot([0, x * 0.7], [0, y * 0.7], color=COLORS['grid'], lw=1.5, zorder=0)
-
-        # Node
-        node_r = 1.1
-        circle = plt.Circle((x, y), node_r, facecolor=color, edgecolor='white',
-                             lw=2, alpha=0.9, zorder=3)
-        ax.add_patch(circle)
+    node_r = 1.1
+    angles = 2 * np.pi * np.arange(n) / n - np.pi / 2
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    xs, ys = radius * cos_a, radius * sin_a
+
+    # Spoke lines — drawn behind everything (low zorder), as one collection
+    ax.add_collection(LineCollection(
+        np.stack([np.zeros((n, 2)), np.column_stack([xs * 0.7, ys * 0.7])], axis=1),
+        colors=COLORS['grid'], linewidths=1.5, capstyle='projecting', zorder=0))
+    # Nodes
+    ax.add_collection(PatchCollection(
+        [plt.Circle((x, y), node_r) for x, y in zip(xs, ys)],
+        facecolors=[c for _, _, c in disciplines], edgecolors='white',
+        linewidths=2, alpha=0.9, zorder=3))
+
+    # Concept labels — pushed farther out with higher zorder
+    # Increase distance for near-horizontal positions (3/9 o'clock) where
+    # multi-line text boxes are wider and would overlap circles
+    concept_r = radius + 2.2 + 0.8 * np.abs(cos_a)
+    cxs, cys = concept_r * cos_a, concept_r * sin_a
+
+    for (name, concepts, _), x, y, cx, cy in zip(disciplines, xs, ys, cxs, cys):
         ax.text(x, y, name, ha='center', va='center', fontsize=10,
                 fontweight='bold', color='white', zorder=4)
-
-        # Concept labels — pushed farther out with higher zorder
-        # Increase distance for near-horizontal positions (3/9 o'clock) where
-        # multi-line text boxes are wider and would overlap circles
-        base_concept_r = radius + 2.2
-        cos_val = abs(np.cos(angle))
-        extra = 0.8 * cos_val  # extra push for horizontal positions
-        concept_r = base_concept_r + extra
-        cx = concept_r * np.cos(angle)
-        cy = concept_r * np.sin(angle)
         ax.text(cx, cy, concepts, ha='center', va='center', fontsize=10,
                 color=COLORS['text'], style='italic', zorder=5,
                 bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
@@ -1040,8 +1120,7 @@ def exhibit_23():
 # ═══════════════════════════════════════════════════════════════
 def exhibit_20():
     """PID Gain Sensitivity: final deviation from N* across gain values."""
-    sens_path = Path(__file__).resolve().parent.parent / "results" / "sensitivity_results.csv"
-    df = pd.read_csv(sens_path)
+    df = load_result("sensitivity_results.csv")
 
     fig, axes = plt.subplots(1, 3, figsize=(14, 5), sharey=True)
 
@@ -1059,7 +1138,9 @@ def exhibit_20():
         # Mark the chosen gain value
         chosen = {"Kp": 0.8, "Ki": 0.15, "Kd": 0.2}[param]
         ax.axvline(chosen, color=COLORS['accent2'], ls='--', lw=1.5, alpha=0.7)
-        ax.text(chosen, ax.get_ylim()[1] * 0.95 if ax.get_ylim()[1] > 0 else 50,
+        # One autoscale read per panel (limits so far; later panels share y)
+        ymax = ax.get_ylim()[1]
+        ax.text(chosen, ymax * 0.95 if ymax > 0 else 50,
                 f' chosen={chosen}',
                 fontsize=8, color=COLORS['accent2'], va='top')
 
@@ -1082,8 +1163,7 @@ def exhibit_20():
 # ═══════════════════════════════════════════════════════════════
 def exhibit_21():
     """Slashing parameter sensitivity: supply impact across scenarios."""
-    slash_path = ROOT / "results" / "slashing_sensitivity_results.csv"
-    df = pd.read_csv(slash_path)
+    df = load_result("slashing_sensitivity_results.csv")
 
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5), sharey=True)
 
@@ -1097,7 +1177,8 @@ def exhibit_21():
     # Healthy zone shading
     ax1.axhspan(-50, 10, alpha=0.06, color=COLORS['accent4'])
     ax1.axvline(0.10, color=COLORS['accent2'], ls='--', lw=1.5, alpha=0.7)
-    ax1.text(0.10, ax1.get_ylim()[1] * 0.95 if ax1.get_ylim()[1] > 0 else 5,
+    ymax = ax1.get_ylim()[1]
+    ax1.text(0.10, ymax * 0.95 if ymax > 0 else 5,
              ' chosen=0.10', fontsize=8, color=COLORS['accent2'], va='top')
     ax1.set_xlabel("Downtime Penalty (fraction of stake)")
     ax1.set_ylabel("Circulating Supply Change (%)")
@@ -1113,7 +1194,8 @@ def exhibit_21():
 
     ax2.axhspan(-50, 10, alpha=0.06, color=COLORS['accent4'])
     ax2.axvline(1.00, color=COLORS['accent2'], ls='--', lw=1.5, alpha=0.7)
-    ax2.text(1.00, ax2.get_ylim()[1] * 0.95 if ax2.get_ylim()[1] > 0 else 5,
+    ymax = ax2.get_ylim()[1]
+    ax2.text(1.00, ymax * 0.95 if ymax > 0 else 5,
              ' chosen=1.00', fontsize=8, color=COLORS['accent2'], va='top')
     ax2.set_xlabel("Fraud Penalty (fraction of stake)")
     ax2.set_title("Fraud Penalty Sensitivity")
@@ -1134,7 +1216,8 @@ def exhibit_21():
 # EXHIBIT 17: Ensemble Node Count Distributions (240-run)
 # ═══════════════════════════════════════════════════════════════
 def exhibit_17():
-    ms = pd.read_csv(ROOT / "results" / "multi_seed_results.csv")
+    ms = load_result("multi_seed_results.csv")
+    groups = ensemble_groups()
     scenarios = ['bull', 'competitor', 'regulatory', 'bear']
     titles = {'bull': 'Bull', 'competitor': 'Competitor Entry',
               'regulatory': 'Regulatory Shock', 'bear': 'Bear Market'}
@@ -1145,39 +1228,28 @@ def exhibit_17():
 
     for idx, scen in enumerate(scenarios):
         ax = axes[idx // 2][idx % 2]
-        pid = ms[(ms['scenario'] == scen) & (ms['emission_model'] == 'pid')]['final_N']
-        static = ms[(ms['scenario'] == scen) & (ms['emission_model'] == 'static')]['final_N']
+        pid = groups[(scen, 'pid')]['final_N'].to_numpy()
+        static = groups[(scen, 'static')]['final_N'].to_numpy()
 
         positions = [0, 1]
-        bp = ax.boxplot([pid.values, static.values], positions=positions, widths=0.5,
+        bp = ax.boxplot([pid, static], positions=positions, widths=0.5,
                         patch_artist=True, showfliers=True,
                         flierprops=dict(marker='o', markersize=4, alpha=0.4),
-                        whiskerprops=dict(linewidth=1.5),
-                        capprops=dict(linewidth=1.5))
-        for i, box in enumerate(bp['boxes']):
-            box.set_facecolor(COLORS['accent6'] if i == 0 else COLORS['mid_gray'])
-            box.set_alpha(0.7 if i == 0 else 0.5)
-            box.set_linewidth(1)
-            box.set_zorder(2)
-        for whisker in bp['whiskers']:
-            whisker.set_color('black')
-            whisker.set_linewidth(1.5)
-            whisker.set_zorder(3)
-        for median in bp['medians']:
-            median.set_color('white')
-            median.set_linewidth(4)
-            median.set_zorder(5)
-        for cap in bp['caps']:
-            cap.set_color('black')
-            cap.set_linewidth(1.5)
-            cap.set_zorder(6)
+                        boxprops=dict(linewidth=1, zorder=2),
+                        whiskerprops=dict(color='black', linewidth=1.5, zorder=3),
+                        medianprops=dict(color='white', linewidth=4, zorder=5),
+                        capprops=dict(color='black', linewidth=1.5, zorder=6))
+        for box, color, alpha in zip(bp['boxes'], (COLORS['accent6'], COLORS['mid_gray']),
+                                     (0.7, 0.5)):
+            box.set_facecolor(color)
+            box.set_alpha(alpha)
 
         # When median==Q3, the white median hides the box top border.
         # Redraw box top edge on top of everything.
         box_width = 0.5
-        for i, data in enumerate([pid.values, static.values]):
+        for i, data in enumerate([pid, static]):
             q3 = np.percentile(data, 75)
-            med = np.median(data)
+            med = bp['medians'][i].get_ydata()[0]
             pos = positions[i]
             half_bw = box_width / 2
             if med == q3:
@@ -1190,10 +1262,10 @@ def exhibit_17():
                 color=COLORS['accent2'], va='center', ha='right')
 
         # Annotate CV and p5 below x-axis labels
-        pid_cv = pid.std() / pid.mean() if pid.mean() > 0 else 0
-        static_cv = static.std() / static.mean() if static.mean() > 0 else 0
-        pid_p5 = pid.quantile(0.05)
-        static_p5 = static.quantile(0.05)
+        # Sample std (ddof=1) and linear p5, as pandas computed them
+        pid_cv = pid.std(ddof=1) / pid.mean() if pid.mean() > 0 else 0
+        static_cv = static.std(ddof=1) / static.mean() if static.mean() > 0 else 0
+        pid_p5, static_p5 = np.quantile(pid, 0.05), np.quantile(static, 0.05)
 
         ax.set_xticks(positions)
         ax.set_xticklabels([f"PID\nCV={pid_cv:.3f}, p5={pid_p5:,.0f}",
@@ -1231,7 +1303,7 @@ def exhibit_17():
 # EXHIBIT 19: Ensemble Price Distributions (240-run)
 # ═══════════════════════════════════════════════════════════════
 def exhibit_19():
-    ms = pd.read_csv(ROOT / "results" / "multi_seed_results.csv")
+    groups = ensemble_groups()
     scenarios = ['bull', 'competitor', 'regulatory', 'bear']
     titles = {'bull': 'Bull', 'competitor': 'Competitor Entry',
               'regulatory': 'Regulatory Shock', 'bear': 'Bear Market'}
@@ -1242,31 +1314,29 @@ def exhibit_19():
 
     for idx, scen in enumerate(scenarios):
         ax = axes[idx // 2][idx % 2]
-        pid = ms[(ms['scenario'] == scen) & (ms['emission_model'] == 'pid')]['final_P']
-        static = ms[(ms['scenario'] == scen) & (ms['emission_model'] == 'static')]['final_P']
+        pid = groups[(scen, 'pid')]['final_P'].to_numpy()
+        static = groups[(scen, 'static')]['final_P'].to_numpy()
 
         positions = [0, 1]
-        bp = ax.boxplot([pid.values, static.values], positions=positions, widths=0.5,
+        bp = ax.boxplot([pid, static], positions=positions, widths=0.5,
                         patch_artist=True, showfliers=True,
                         flierprops=dict(marker='o', markersize=4, alpha=0.4),
                         whiskerprops=dict(linewidth=1.5),
+                        medianprops=dict(color='white', linewidth=2),
                         capprops=dict(linewidth=1.5))
         bp['boxes'][0].set_facecolor(COLORS['accent6'])
         bp['boxes'][0].set_alpha(0.7)
         bp['boxes'][1].set_facecolor(COLORS['mid_gray'])
         bp['boxes'][1].set_alpha(0.5)
-        for median in bp['medians']:
-            median.set_color('white')
-            median.set_linewidth(2)
 
         # Log scale for price
         ax.set_yscale('log')
 
         # Annotate CV and p5
-        pid_cv = pid.std() / pid.mean() if pid.mean() > 0 else 0
-        static_cv = static.std() / static.mean() if static.mean() > 0 else 0
-        pid_p5 = pid.quantile(0.05)
-        static_p5 = static.quantile(0.05)
+        # Sample std (ddof=1) and linear p5, as pandas computed them
+        pid_cv = pid.std(ddof=1) / pid.mean() if pid.mean() > 0 else 0
+        static_cv = static.std(ddof=1) / static.mean() if static.mean() > 0 else 0
+        pid_p5, static_p5 = np.quantile(pid, 0.05), np.quantile(static, 0.05)
 
         ax.set_xticks(positions)
         ax.set_xticklabels([f"PID\nCV={pid_cv:.3f}, p5=${pid_p5:.2f}",
@@ -1314,22 +1384,40 @@ ALL_EXHIBITS = [
 ]
 
 
+def _render(item):
+    """Worker: draw one exhibit, returning (ok, captured output) so the parent
+    can print logs in ALL_EXHIBITS order."""
+    name, func = item
+    setup_style()
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        try:
+            print(f"\n{name}...")
+            func()
+            ok = True
+        except Exception as e:
+            print(f"  FAILED: {e}")
+            print(traceback.format_exc(), end="")
+            ok = False
+    return ok, buf.getvalue()
+
+
 def main():
     setup_style()
     print("=" * 60)
     print(f"GENERATING {len(ALL_EXHIBITS)} EXHIBITS")
     print("=" * 60)
 
+    # Exhibits are independent (shared read-only inputs, one PNG each):
+    # render them in parallel, one process per core
+    workers = min(len(ALL_EXHIBITS), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(_render, ALL_EXHIBITS))
+
     success = 0
-    for name, func in ALL_EXHIBITS:
-        try:
-            print(f"\n{name}...")
-            func()
-            success += 1
-        except Exception as e:
-            print(f"  FAILED: {e}")
-            import traceback
-            traceback.print_exc()
+    for ok, log in results:
+        print(log, end="")
+        success += ok
 
     print(f"\n{'=' * 60}")
     print(f"Generated {success}/{len(ALL_EXHIBITS)} exhibits in {EXHIBITS_DIR}")
@@ -7,10 +7,15 @@ Kp held at default 0.80.
 Key question: Does Ki non-monotonicity in bear scenarios survive when Kd co-varies?
 Output: results/interaction_sweep_results.csv
 """
+import io
+import os
 import sys
+import argparse
+import contextlib
 import numpy as np
 import pandas as pd
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from meshnet_model import (run_simulation, SCENARIOS, SEED, N_TARGET,
@@ -20,49 +25,60 @@ KI_VALUES = [0.05, 0.10, 0.15, 0.25, 0.35]
 KD_VALUES = [0.05, 0.10, 0.20, 0.35, 0.50]
 
 
-def main():
+def _run(job):
+    """Worker: one (Ki, Kd, scenario) run, returned as a results row.
+    When quiet, the run's stderr progress (including run_simulation's
+    yearly lines) is discarded."""
+    count, total, ki, kd, sname, scenario, seed, quiet = job
+    progress = contextlib.redirect_stderr(io.StringIO()) if quiet else contextlib.nullcontext()
+    with progress:
+        print(f"  [{count}/{total}] Ki={ki:.2f}, Kd={kd:.2f}, {sname}",
+              file=sys.stderr)
+        run = run_simulation(sname, scenario, True, seed,
+                             kp=KP_NORM, ki=ki, kd=kd, return_arrays=True)
+    e_series = run["E"]
+    final_N = int(run["N"][-1])
+
+    return {
+        "Ki": ki,
+        "Kd": kd,
+        "Kp": KP_NORM,
+        "scenario": sname,
+        "final_N": final_N,
+        "dev_from_target": round(abs(final_N - N_TARGET) / N_TARGET, 4),
+        "total_emission": float(e_series.sum()),
+        "total_slashed": run["slashed_total"],
+        "final_C": float(run["C"][-1]),
+        "final_P": float(run["P"][-1]),
+        "at_floor_steps": int(np.count_nonzero(e_series <= PID_MIN + 1)),
+        "at_ceiling_steps": int(np.count_nonzero(e_series >= PID_MAX - 1)),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ki × Kd interaction sweep")
+    parser.add_argument("--quiet", action="store_true",
+                        help="suppress per-run progress on stderr")
+    args = parser.parse_args(argv)
+
     print("=" * 60)
     print("Ki × Kd INTERACTION SWEEP")
     print(f"Grid: {len(KI_VALUES)}×{len(KD_VALUES)} = {len(KI_VALUES)*len(KD_VALUES)} pairs "
           f"× {len(SCENARIOS)} scenarios = {len(KI_VALUES)*len(KD_VALUES)*len(SCENARIOS)} runs")
     print("=" * 60)
 
-    results = []
     total = len(KI_VALUES) * len(KD_VALUES) * len(SCENARIOS)
-    count = 0
-
+    jobs = []
     for ki in KI_VALUES:
         for kd in KD_VALUES:
             for scenario_idx, (sname, scenario) in enumerate(SCENARIOS.items()):
-                count += 1
-                seed = SEED + scenario_idx
-                print(f"  [{count}/{total}] Ki={ki:.2f}, Kd={kd:.2f}, {sname}",
-                      file=sys.stderr)
-
-                records = run_simulation(sname, scenario, True, seed,
-                                         kp=KP_NORM, ki=ki, kd=kd)
-                final = records[-1]
-                n_series = [r["N"] for r in records]
-                e_series = [r["E"] for r in records]
-
-                # Count timesteps at floor/ceiling
-                at_floor = sum(1 for e in e_series if e <= PID_MIN + 1)
-                at_ceiling = sum(1 for e in e_series if e >= PID_MAX - 1)
-
-                results.append({
-                    "Ki": ki,
-                    "Kd": kd,
-                    "Kp": KP_NORM,
-                    "scenario": sname,
-                    "final_N": final["N"],
-                    "dev_from_target": round(abs(final["N"] - N_TARGET) / N_TARGET, 4),
-                    "total_emission": sum(r["E"] for r in records),
-                    "total_slashed": final["slashed_total"],
-                    "final_C": round(final["C"], 0),
-                    "final_P": final["P"],
-                    "at_floor_steps": at_floor,
-                    "at_ceiling_steps": at_ceiling,
-                })
+                jobs.append((len(jobs) + 1, total, ki, kd, sname, scenario,
+                             SEED + scenario_idx, args.quiet))
+
+    # Runs are independent and CPU-bound: one process per (Ki, Kd, scenario);
+    # ex.map keeps the rows in grid order
+    with ProcessPoolExecutor(max_workers=min(total, os.cpu_count() or 1)) as ex:
+        results = list(ex.map(_run, jobs))
 
     df = pd.DataFrame(results)
     out = RESULTS_DIR / "interaction_sweep_results.csv"
@@ -72,14 +88,15 @@ def main():
     # Report bear scenario Ki non-monotonicity
     print("\n── Ki Non-Monotonicity in Bear (with Kd co-varying) ──")
     bear = df[df["scenario"] == "bear"]
-    pivot = bear.pivot_table(values="dev_from_target", index="Ki", columns="Kd")
+    # One value per (Ki, Kd) cell by construction: reshape, no aggregation
+    pivot = bear.set_index(["Ki", "Kd"])["dev_from_target"].unstack("Kd").sort_index()
     print(pivot.round(3).to_string())
 
     # Check if ordering is consistent across Kd values
     for kd in KD_VALUES:
         sub = bear[bear["Kd"] == kd].sort_values("Ki")
         devs = sub["dev_from_target"].values
-        monotonic = all(devs[i] <= devs[i+1] for i in range(len(devs)-1))
+        monotonic = bool(np.all(np.diff(devs) >= 0))
         print(f"  Kd={kd:.2f}: Ki ordering monotonic={monotonic}, "
               f"devs={[f'{d:.3f}' for d in devs]}")
 
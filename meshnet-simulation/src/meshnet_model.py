@@ -138,6 +138,17 @@ def create_operators(n, rng):
     return agents
 
 
+def operator_arrays(agents):
+    """Struct-of-arrays view of the operator population for vectorized analysis:
+    float64 'stake' and 'reputation', bool 'active', one entry per agent."""
+    n = len(agents)
+    return {
+        "stake": np.fromiter((a["stake"] for a in agents), dtype=np.float64, count=n),
+        "reputation": np.fromiter((a["reputation"] for a in agents), dtype=np.float64, count=n),
+        "active": np.fromiter((a["active"] for a in agents), dtype=bool, count=n),
+    }
+
+
 def create_whales(rng):
     """Create 5 whale agents."""
     return [
@@ -228,7 +239,9 @@ def update_operators(agents, E, F_daily, N, P, scenario, t, rng, T,
                      cost_mult=1.0, slash_downtime=None, slash_fraud=None):
     """PSUB 4+5: Staking/slashing, treasury stabilization, and entry/exit.
     Changes from v1: reduced exit prob (1B), lower opportunity cost (1B),
-    veteran cooling-off (1B), treasury yield floor (1E)."""
+    veteran cooling-off (1B), treasury yield floor (1E).
+    Also returns the active operator count after entry/exit, tracked
+    incrementally so callers need not rescan the population."""
     sd = slash_downtime if slash_downtime is not None else SLASH_DOWNTIME
     sf = slash_fraud if slash_fraud is not None else SLASH_FRAUD
     active = [a for a in agents if a["active"]]
@@ -237,12 +250,13 @@ def update_operators(agents, E, F_daily, N, P, scenario, t, rng, T,
     treasury_subsidy = 0
 
     if len(active) == 0:
-        return agents, slashed, fraud_captured, treasury_subsidy
+        return agents, slashed, fraud_captured, treasury_subsidy, 0
 
     active_count = len(active)
     per_op_emission = E / max(active_count, 1)
     per_op_fee = (F_daily * (1 - PROTOCOL_FEE)) / max(active_count, 1)
     op_cost = (3.0 + rng.normal(0, 0.5)) * cost_mult  # ~$3/day base operating cost
+    exited = 0
 
     for a in active:
         # Uptime jitter
@@ -277,6 +291,9 @@ def update_operators(agents, E, F_daily, N, P, scenario, t, rng, T,
         if a["stake"] <= 0:
             a["active"] = False
 
+        if not a["active"]:
+            exited += 1
+
     # Treasury yield stabilization (1E): floor at 50% of opportunity cost
     per_op_yield_usd = (per_op_emission + per_op_fee) * P
     if per_op_yield_usd < 0.5 * OPPORTUNITY_COST and T > TOTAL_SUPPLY * 0.02:
@@ -287,7 +304,8 @@ def update_operators(agents, E, F_daily, N, P, scenario, t, rng, T,
             treasury_subsidy = total_subsidy
 
     # New entrants: soft cap with decreasing entry rate above target
-    active_count = sum(1 for a in agents if a["active"])
+    active_count = len(active) - exited
+    n_active = active_count
     token_yield_usd = (per_op_emission + per_op_fee) * P
     if token_yield_usd > 2.0 * OPPORTUNITY_COST:  # 2× opp cost to justify new hardware
         # Entry rate tapers: 100% at N*, 50% at 1.1×N*, 0% at 1.2×N* (= 12,000)
@@ -311,6 +329,7 @@ def update_operators(agents, E, F_daily, N, P, scenario, t, rng, T,
                 "active": True,
                 "seasons_active": 0,
             })
+        n_active += new_count
 
     # Operator poach shock
     shock_day = (scenario.get("shock_month") or 999) * 30
@@ -321,8 +340,9 @@ def update_operators(agents, E, F_daily, N, P, scenario, t, rng, T,
             if a["active"] and a["type"] != "high_commitment" and poached < poach_n:
                 a["active"] = False
                 poached += 1
+        n_active -= poached
 
-    return agents, slashed, fraud_captured, treasury_subsidy
+    return agents, slashed, fraud_captured, treasury_subsidy, n_active
 
 
 def update_reputation(agents, t):
@@ -358,8 +378,13 @@ def update_price(P, F_daily, C, drift, rng):
 
 def run_simulation(scenario_name: str, scenario: dict, use_pid: bool, seed: int,
                    kp=None, ki=None, kd=None,
-                   slash_downtime=None, slash_fraud=None) -> list:
-    """Run one simulation configuration for 1,825 timesteps."""
+                   slash_downtime=None, slash_fraud=None,
+                   return_final_agents=False, return_arrays=False) -> list:
+    """Run one simulation configuration for 1,825 timesteps.
+    With return_arrays=True, returns per-step "N", "E", "C" and "P" arrays
+    (rounded as in the records) plus the final "slashed_total" instead of
+    the list of record dicts.
+    With return_final_agents=True, returns (records, operator_arrays(final agents))."""
     rng = np.random.default_rng(seed)
 
     # Initial state
@@ -380,6 +405,9 @@ def run_simulation(scenario_name: str, scenario: dict, use_pid: bool, seed: int,
     whales = create_whales(rng)
 
     records = []
+    if return_arrays:
+        series = {"N": np.empty(TIMESTEPS, dtype=np.int64), "E": np.empty(TIMESTEPS),
+                  "C": np.empty(TIMESTEPS), "P": np.empty(TIMESTEPS)}
 
     for t in range(TIMESTEPS):
         # Cost shock
@@ -402,7 +430,7 @@ def run_simulation(scenario_name: str, scenario: dict, use_pid: bool, seed: int,
         B = burn_tokens(F_daily, P)
 
         # PSUB 4+5: Operators (now includes treasury stabilization)
-        agents, slashed, fraud, treas_subsidy = update_operators(
+        agents, slashed, fraud, treas_subsidy, n_active = update_operators(
             agents, E, F_daily, N, P, scenario, t, rng, T, cost_mult,
             slash_downtime=slash_downtime, slash_fraud=slash_fraud)
         slashed_total += slashed
@@ -421,8 +449,7 @@ def run_simulation(scenario_name: str, scenario: dict, use_pid: bool, seed: int,
         T = max(0, T)
 
         # Active node count
-        N = sum(1 for a in agents if a["active"])
-        N = max(1, N)
+        N = max(1, n_active)
 
         # S2R (burn-mint equilibrium ratio)
         bme = B / max(E, 1)
@@ -432,6 +459,13 @@ def run_simulation(scenario_name: str, scenario: dict, use_pid: bool, seed: int,
             print(f"  [{scenario_name}/{'PID' if use_pid else 'static'}] Year {t//365}: "
                   f"N={N}, P=${P:.4f}, C={C:,.0f}", file=sys.stderr)
 
+        if return_arrays:
+            series["N"][t] = N
+            series["E"][t] = round(E, 0)
+            series["C"][t] = round(C, 0)
+            series["P"][t] = round(P, 6)
+            continue
+
         # Record with run metadata (Enhancement A)
         records.append({
             "seed": seed,
@@ -452,6 +486,11 @@ def run_simulation(scenario_name: str, scenario: dict, use_pid: bool, seed: int,
             "fraud_captured_pct": round(fraud_total / max(E * (t+1), 1) * 100, 4),
         })
 
+    if return_arrays:
+        series["slashed_total"] = slashed_total
+        records = series
+    if return_final_agents:
+        return records, operator_arrays(agents)
     return records
 
 
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Optional Numba import shared by the JIT kernels.
+Without numba installed, `njit` is a no-op decorator, `prange` is `range`,
+and kernels run as plain Python/NumPy.
+"""
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional — same results, just slower
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func